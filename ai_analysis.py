@@ -3,15 +3,87 @@ AI Analysis Module for Options PDF Calculator
 Handles both AI-powered and rule-based analysis
 """
 
-import numpy as np
+import importlib.util
 import os
+import re
+import sys
+from collections import OrderedDict
 
-# Check if Anthropic SDK is available
-try:
-    import anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+from config_loader import get_api_key
+# Imported eagerly so the Numba metrics kernel compiles (or loads from its
+# cache) at startup, not on the first analysis click
+from metrics_kernel import compute_metrics
+
+# Check if Anthropic SDK is available (without importing it at startup)
+ANTHROPIC_AVAILABLE = importlib.util.find_spec('anthropic') is not None
+
+
+# Market data block of the Claude prompt, filled via str.format_map
+_MARKET_DATA_TEMPLATE = """CURRENT STATE:
+- Current Price: ${current_price:.2f}
+- Days to Expiration: {days_to_expiry}
+
+IMPLIED VOLATILITY SMILE:
+- ATM IV: {atm_iv:.1%}
+- Max IV: {max_iv:.1%}
+- Min IV: {min_iv:.1%}
+- IV Range: {iv_range:.1%}
+- Skew (Put IV - Call IV): {skew:.1%}
+
+PROBABILITY DISTRIBUTION:
+- Expected Price (PDF peak): ${expected_price:.2f}
+- 5th Percentile: ${p5_price:.2f}
+- 95th Percentile: ${p95_price:.2f}
+- Expected Move: {expected_move_pct:.2f}%
+- 90% Confidence Range: ±{half_range_90_pct:.2f}%"""
+
+# Static analysis instructions that follow the market data
+_INSTRUCTIONS = """Provide a concise analysis covering:
+1. What the volatility smile shape tells us about market sentiment
+2. Key risks or opportunities revealed by the PDF
+3. Trading implications (bullish/bearish/neutral)
+4. Any notable patterns or anomalies
+
+Keep it practical and actionable. Max 200 words.
+
+IMPORTANT: Use **bold** markdown syntax (e.g., **key point**) to emphasize important findings, numbers, and conclusions. Make the analysis visually scannable."""
+
+_PROMPT_TEMPLATE = ("Analyze these options market data for {ticker}:\n\n"
+                    + _MARKET_DATA_TEMPLATE + "\n\n" + _INSTRUCTIONS)
+
+# Batch requests share one static prefix and one data block per ticker;
+# analyses come back separated by a "---" line
+_BATCH_SEPARATOR = "---"
+_BATCH_PREFIX = ("Analyze each of the tickers below independently, in the order given. "
+                 f"Separate the analyses with a line containing only {_BATCH_SEPARATOR} "
+                 "and do not add any other separators.\n\n"
+                 "For each ticker:\n" + _INSTRUCTIONS)
+_BATCH_TICKER_TEMPLATE = "TICKER {index}: {ticker}\n" + _MARKET_DATA_TEMPLATE
+
+CLAUDE_MODEL = "claude-sonnet-4-20250514"
+
+# Output budget per analysis and per request; larger batches are split so
+# no request asks for more than the model can return
+_TOKENS_PER_ANALYSIS = 1000
+_MAX_OUTPUT_TOKENS = 8192
+_BATCH_SIZE = _MAX_OUTPUT_TOKENS // _TOKENS_PER_ANALYSIS
+
+# Recent analysis texts keyed by a fingerprint of the results (LRU)
+_ANALYSIS_CACHE = OrderedDict()
+_ANALYSIS_CACHE_SIZE = 32
+
+# Anthropic clients keyed by API key, so the connection pool is reused
+_CLIENT_CACHE = {}
+
+
+def _get_client(api_key):
+    """Get a cached Anthropic client for the given API key"""
+    client = _CLIENT_CACHE.get(api_key)
+    if client is None:
+        import anthropic
+        client = anthropic.Anthropic(api_key=api_key)
+        _CLIENT_CACHE[api_key] = client
+    return client
 
 
 def is_ai_available():
@@ -19,7 +91,93 @@ def is_ai_available():
     return ANTHROPIC_AVAILABLE
 
 
-def generate_ai_analysis(results):
+def _extract_metrics(results):
+    """
+    Extract IV smile and PDF metrics shared by AI and basic analysis
+    
+    Parameters:
+    -----------
+    results : dict
+        Dictionary containing analysis data
+    
+    Returns:
+    --------
+    dict : IV metrics (as fractions) and PDF price levels
+    """
+    current_price = results['current_price']
+    pdf_strikes = results['pdf_strikes']
+    
+    (atm_iv, max_iv, min_iv, put_avg_iv, call_avg_iv,
+     peak_idx, p5_idx, p95_idx) = compute_metrics(
+        results['strikes'], results['IVs'],
+        pdf_strikes, results['pdf_values'], current_price
+    )
+    
+    # Skew analysis
+    if put_avg_iv > 0 and call_avg_iv > 0:
+        skew = put_avg_iv - call_avg_iv
+    else:
+        skew = 0
+    
+    return {
+        'atm_iv': atm_iv,
+        'max_iv': max_iv,
+        'min_iv': min_iv,
+        'iv_range': max_iv - min_iv,
+        'skew': skew,
+        'expected_price': pdf_strikes[peak_idx],
+        'p5_price': pdf_strikes[p5_idx],
+        'p95_price': pdf_strikes[p95_idx],
+    }
+
+
+def _prompt_fields(results):
+    """Build the format_map fields for the Claude prompt templates"""
+    current_price = results['current_price']
+    metrics = _extract_metrics(results)
+    
+    metrics['ticker'] = results['ticker']
+    metrics['current_price'] = current_price
+    metrics['days_to_expiry'] = int(results['tau'] * 365)
+    metrics['expected_move_pct'] = (abs(metrics['expected_price'] - current_price)
+                                    / current_price * 100)
+    metrics['half_range_90_pct'] = ((metrics['p95_price'] - metrics['p5_price'])
+                                    / current_price * 100 / 2)
+    return metrics
+
+
+def _api_key_error():
+    """Build the error message shown when no API key can be found"""
+    # Provide detailed error with file location
+    if getattr(sys, 'frozen', False):
+        exe_dir = os.path.dirname(sys.executable)
+        env_path = os.path.join(exe_dir, '.env')
+        exists = os.path.exists(env_path)
+        
+        error_msg = f"❌ **API Key Not Found**\n\n"
+        error_msg += f"**Looking for .env in:**\n{env_path}\n\n"
+        error_msg += f"**File exists:** {exists}\n\n"
+        
+        if exists:
+            try:
+                with open(env_path, 'r') as f:
+                    content = f.read()
+                    error_msg += f"**File contents ({len(content)} chars):**\n{content[:200]}\n\n"
+            except:
+                error_msg += "**Could not read file**\n\n"
+        
+        error_msg += "**Solution:**\n"
+        error_msg += "1. Create a file named `.env`\n"
+        error_msg += "2. Put it in the same folder as the .exe\n"
+        error_msg += "3. Add this line (no quotes):\n"
+        error_msg += "   ANTHROPIC_API_KEY=your-key-here\n"
+        
+        return error_msg
+    
+    return "❌ ANTHROPIC_API_KEY not found in .env file or environment variables."
+
+
+def generate_ai_analysis(results, on_chunk=None):
     """
     Generate AI-powered analysis using Claude API
     
@@ -28,6 +186,8 @@ def generate_ai_analysis(results):
     results : dict
         Dictionary containing analysis data with keys:
         - ticker, current_price, strikes, IVs, pdf_strikes, pdf_values, tau
+    on_chunk : callable, optional
+        Called with each text chunk as the response streams in
     
     Returns:
     --------
@@ -36,152 +196,115 @@ def generate_ai_analysis(results):
     if not ANTHROPIC_AVAILABLE:
         return "❌ Anthropic SDK not installed. Run: pip install anthropic"
     
-    # Check for API key with detailed debugging
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    
-    if not api_key:
-        # Try to load from .env again
-        load_env_file()
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-    
-    if not api_key:
-        # Last resort: try to read .env file directly from exe directory
-        if getattr(sys, 'frozen', False):
-            exe_dir = os.path.dirname(sys.executable)
-            env_path = os.path.join(exe_dir, '.env')
-            
-            if os.path.exists(env_path):
-                try:
-                    with open(env_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        for line in content.split('\n'):
-                            if 'ANTHROPIC_API_KEY' in line and '=' in line:
-                                api_key = line.split('=', 1)[1].strip().strip('"').strip("'")
-                                break
-                except Exception as e:
-                    pass
+    # Environment, then .env / config.txt next to the exe or script
+    api_key = get_api_key()
     
     if not api_key:
-        # Provide detailed error with file location
-        if getattr(sys, 'frozen', False):
-            exe_dir = os.path.dirname(sys.executable)
-            env_path = os.path.join(exe_dir, '.env')
-            exists = os.path.exists(env_path)
-            
-            error_msg = f"❌ **API Key Not Found**\n\n"
-            error_msg += f"**Looking for .env in:**\n{env_path}\n\n"
-            error_msg += f"**File exists:** {exists}\n\n"
-            
-            if exists:
-                try:
-                    with open(env_path, 'r') as f:
-                        content = f.read()
-                        error_msg += f"**File contents ({len(content)} chars):**\n{content[:200]}\n\n"
-                except:
-                    error_msg += "**Could not read file**\n\n"
-            
-            error_msg += "**Solution:**\n"
-            error_msg += "1. Create a file named `.env`\n"
-            error_msg += "2. Put it in the same folder as the .exe\n"
-            error_msg += "3. Add this line (no quotes):\n"
-            error_msg += "   ANTHROPIC_API_KEY=your-key-here\n"
-            
-            return error_msg
-        else:
-            return "❌ ANTHROPIC_API_KEY not found in .env file or environment variables."
+        return _api_key_error()
     
     ticker = results['ticker']
-    current_price = results['current_price']
-    tau = results['tau']
-    days_to_expiry = int(tau * 365)
-    
-    # Extract IV metrics
-    strikes = results['strikes']
-    IVs = results['IVs']
-    
-    atm_idx = np.argmin(np.abs(strikes - current_price))
-    atm_iv = IVs[atm_idx] * 100
-    
-    max_iv = np.max(IVs) * 100
-    min_iv = np.min(IVs) * 100
-    iv_range = max_iv - min_iv
-    
-    # Skew analysis
-    otm_put_ivs = IVs[strikes < current_price * 0.95]
-    otm_call_ivs = IVs[strikes > current_price * 1.05]
     
-    if len(otm_put_ivs) > 0 and len(otm_call_ivs) > 0:
-        put_avg_iv = np.mean(otm_put_ivs) * 100
-        call_avg_iv = np.mean(otm_call_ivs) * 100
-        skew = put_avg_iv - call_avg_iv
-    else:
-        skew = 0
+    # Build prompt for Claude
+    prompt = _PROMPT_TEMPLATE.format_map(_prompt_fields(results))
+
+    try:
+        client = _get_client(api_key)
+        
+        header = f"🤖 AI ANALYSIS FOR {ticker} (Powered by Claude)\n{'='*50}\n\n"
+        chunks = [header]
+        if on_chunk:
+            on_chunk(header)
+        
+        # Stream so the UI can show text as soon as the first tokens arrive
+        with client.messages.stream(
+            model=CLAUDE_MODEL,
+            max_tokens=_TOKENS_PER_ANALYSIS,
+            messages=[
+                {"role": "user", "content": prompt}
+            ]
+        ) as stream:
+            for text in stream.text_stream:
+                chunks.append(text)
+                if on_chunk:
+                    on_chunk(text)
+        
+        return ''.join(chunks)
+        
+    except Exception as e:
+        return f"❌ AI Analysis Error: {str(e)}\n\nFalling back to basic analysis..."
+
+
+def generate_ai_analysis_batch(results_list):
+    """
+    Generate AI-powered analyses for several tickers in few Claude requests
     
-    # PDF metrics
-    pdf_strikes = results['pdf_strikes']
-    pdf_values = results['pdf_values']
+    Tickers are sent in groups of _BATCH_SIZE, one request per group.
     
-    peak_idx = np.argmax(pdf_values)
-    expected_price = pdf_strikes[peak_idx]
+    Parameters:
+    -----------
+    results_list : list of dict
+        Analysis data dictionaries, as accepted by generate_ai_analysis
     
-    # Calculate percentiles
-    cumulative = np.cumsum(pdf_values) * (pdf_strikes[1] - pdf_strikes[0])
-    p5_idx = np.argmin(np.abs(cumulative - 0.05))
-    p95_idx = np.argmin(np.abs(cumulative - 0.95))
+    Returns:
+    --------
+    list of str : One analysis text per entry, in the same order
+    """
+    if not results_list:
+        return []
     
-    p5_price = pdf_strikes[p5_idx]
-    p95_price = pdf_strikes[p95_idx]
+    if not ANTHROPIC_AVAILABLE:
+        return ["❌ Anthropic SDK not installed. Run: pip install anthropic"] * len(results_list)
     
-    expected_move_pct = abs(expected_price - current_price) / current_price * 100
-    range_90_pct = (p95_price - p5_price) / current_price * 100
+    api_key = get_api_key()
+    if not api_key:
+        return [_api_key_error()] * len(results_list)
     
-    # Build prompt for Claude
-    prompt = f"""Analyze these options market data for {ticker}:
-
-CURRENT STATE:
-- Current Price: ${current_price:.2f}
-- Days to Expiration: {days_to_expiry}
+    analyses = []
+    for start in range(0, len(results_list), _BATCH_SIZE):
+        analyses.extend(_generate_batch_request(
+            results_list[start:start + _BATCH_SIZE], api_key))
+    return analyses
 
-IMPLIED VOLATILITY SMILE:
-- ATM IV: {atm_iv:.1f}%
-- Max IV: {max_iv:.1f}%
-- Min IV: {min_iv:.1f}%
-- IV Range: {iv_range:.1f}%
-- Skew (Put IV - Call IV): {skew:.1f}%
-
-PROBABILITY DISTRIBUTION:
-- Expected Price (PDF peak): ${expected_price:.2f}
-- 5th Percentile: ${p5_price:.2f}
-- 95th Percentile: ${p95_price:.2f}
-- Expected Move: {expected_move_pct:.2f}%
-- 90% Confidence Range: ±{range_90_pct/2:.2f}%
-
-Provide a concise analysis covering:
-1. What the volatility smile shape tells us about market sentiment
-2. Key risks or opportunities revealed by the PDF
-3. Trading implications (bullish/bearish/neutral)
-4. Any notable patterns or anomalies
-
-Keep it practical and actionable. Max 200 words.
-
-IMPORTANT: Use **bold** markdown syntax (e.g., **key point**) to emphasize important findings, numbers, and conclusions. Make the analysis visually scannable."""
 
+def _generate_batch_request(results_list, api_key):
+    """One Claude request for at most _BATCH_SIZE tickers"""
+    blocks = []
+    for index, results in enumerate(results_list, start=1):
+        fields = _prompt_fields(results)
+        fields['index'] = index
+        blocks.append(_BATCH_TICKER_TEMPLATE.format_map(fields))
+    
     try:
-        client = anthropic.Anthropic(api_key=api_key)
+        client = _get_client(api_key)
         
         message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1000,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
+            model=CLAUDE_MODEL,
+            max_tokens=min(_TOKENS_PER_ANALYSIS * len(results_list), _MAX_OUTPUT_TOKENS),
+            messages=[{
+                "role": "user",
+                "content": _BATCH_PREFIX + "\n\n" + "\n\n".join(blocks)
+            }]
         )
         
-        analysis = message.content[0].text
-        return f"🤖 AI ANALYSIS FOR {ticker} (Powered by Claude)\n{'='*50}\n\n{analysis}"
+        text = message.content[0].text
         
     except Exception as e:
-        return f"❌ AI Analysis Error: {str(e)}\n\nFalling back to basic analysis..."
+        error = f"❌ AI Analysis Error: {str(e)}\n\nFalling back to basic analysis..."
+        return [error] * len(results_list)
+    
+    parts = [part.strip() for part in re.split(rf'^\s*{_BATCH_SEPARATOR}\s*$', text, flags=re.M)]
+    parts = [part for part in parts if part]
+    if len(parts) != len(results_list):
+        error = (f"❌ AI Analysis Error: expected {len(results_list)} analyses, "
+                 f"got {len(parts)}\n\nFalling back to basic analysis...")
+        return [error] * len(results_list)
+    
+    analyses = []
+    for results, part in zip(results_list, parts):
+        analysis = f"🤖 AI ANALYSIS FOR {results['ticker']} (Powered by Claude)\n{'='*50}\n\n{part}"
+        _cache_analysis(_results_fingerprint(results, True), analysis)
+        analyses.append(analysis)
+    return analyses
 
 
 def generate_basic_analysis(results):
@@ -203,43 +326,17 @@ def generate_basic_analysis(results):
     days_to_expiry = int(tau * 365)
     
     # Extract metrics
-    strikes = results['strikes']
-    IVs = results['IVs']
-    
-    atm_idx = np.argmin(np.abs(strikes - current_price))
-    atm_iv = IVs[atm_idx] * 100
-    
-    max_iv = np.max(IVs) * 100
-    min_iv = np.min(IVs) * 100
-    
-    # Skew analysis
-    otm_put_ivs = IVs[strikes < current_price * 0.95]
-    otm_call_ivs = IVs[strikes > current_price * 1.05]
-    
-    if len(otm_put_ivs) > 0 and len(otm_call_ivs) > 0:
-        put_avg_iv = np.mean(otm_put_ivs) * 100
-        call_avg_iv = np.mean(otm_call_ivs) * 100
-        skew = put_avg_iv - call_avg_iv
-    else:
-        skew = 0
-    
-    # PDF metrics
-    pdf_strikes = results['pdf_strikes']
-    pdf_values = results['pdf_values']
-    
-    peak_idx = np.argmax(pdf_values)
-    expected_price = pdf_strikes[peak_idx]
-    
-    # Calculate percentiles
-    cumulative = np.cumsum(pdf_values) * (pdf_strikes[1] - pdf_strikes[0])
-    p5_idx = np.argmin(np.abs(cumulative - 0.05))
-    p95_idx = np.argmin(np.abs(cumulative - 0.95))
-    
-    p5_price = pdf_strikes[p5_idx]
-    p95_price = pdf_strikes[p95_idx]
-    
-    # Build analysis
-    analysis = f"""📊 MARKET ANALYSIS FOR {ticker}
+    metrics = _extract_metrics(results)
+    atm_iv = metrics['atm_iv']
+    max_iv = metrics['max_iv']
+    min_iv = metrics['min_iv']
+    skew = metrics['skew']
+    expected_price = metrics['expected_price']
+    p5_price = metrics['p5_price']
+    p95_price = metrics['p95_price']
+    
+    # Build analysis from fragments joined once at the end
+    parts = [f"""📊 MARKET ANALYSIS FOR {ticker}
 {'='*50}
 
 CURRENT STATE:
@@ -248,68 +345,85 @@ CURRENT STATE:
 • Days to Expiry: {days_to_expiry}
 
 VOLATILITY ASSESSMENT:
-• ATM IV: {atm_iv:.1f}%
-• Max IV: {max_iv:.1f}%
-• Min IV: {min_iv:.1f}%
-"""
+• ATM IV: {atm_iv:.1%}
+• Max IV: {max_iv:.1%}
+• Min IV: {min_iv:.1%}
+"""]
     
     # IV level assessment
-    if atm_iv > 40:
-        analysis += "• Level: HIGH - Options expensive\n"
-        analysis += "• Strategy: Consider selling premium\n"
-    elif atm_iv > 25:
-        analysis += "• Level: MODERATE - Normal range\n"
-        analysis += "• Strategy: Balanced approach\n"
+    if atm_iv > 0.40:
+        parts.append("• Level: HIGH - Options expensive\n"
+                     "• Strategy: Consider selling premium\n")
+    elif atm_iv > 0.25:
+        parts.append("• Level: MODERATE - Normal range\n"
+                     "• Strategy: Balanced approach\n")
     else:
-        analysis += "• Level: LOW - Options cheap\n"
-        analysis += "• Strategy: Consider buying options\n"
-    
-    analysis += f"\nSKEW ANALYSIS:\n• Put IV - Call IV: {skew:+.1f}%\n"
-    
-    if skew > 5:
-        analysis += "• Pattern: Strong downside fear\n"
-        analysis += "• Interpretation: Classic equity skew\n"
-        analysis += "• Note: Puts expensive, calls cheap\n"
-    elif skew < -5:
-        analysis += "• Pattern: Reverse skew (unusual)\n"
-        analysis += "• Interpretation: Upside concerns\n"
-        analysis += "• Note: Calls expensive, puts cheap\n"
+        parts.append("• Level: LOW - Options cheap\n"
+                     "• Strategy: Consider buying options\n")
+    
+    parts.append(f"\nSKEW ANALYSIS:\n• Put IV - Call IV: {skew:+.1%}\n")
+    
+    if skew > 0.05:
+        parts.append("• Pattern: Strong downside fear\n"
+                     "• Interpretation: Classic equity skew\n"
+                     "• Note: Puts expensive, calls cheap\n")
+    elif skew < -0.05:
+        parts.append("• Pattern: Reverse skew (unusual)\n"
+                     "• Interpretation: Upside concerns\n"
+                     "• Note: Calls expensive, puts cheap\n")
     else:
-        analysis += "• Pattern: Balanced smile\n"
-        analysis += "• Interpretation: Symmetric risk view\n"
+        parts.append("• Pattern: Balanced smile\n"
+                     "• Interpretation: Symmetric risk view\n")
     
-    analysis += f"\nPROBABILITY DISTRIBUTION:\n"
-    analysis += f"• 5th Percentile: ${p5_price:.2f}\n"
-    analysis += f"• 95th Percentile: ${p95_price:.2f}\n"
-    analysis += f"• 90% Range: ${p5_price:.2f} - ${p95_price:.2f}\n"
+    parts.append(f"\nPROBABILITY DISTRIBUTION:\n"
+                 f"• 5th Percentile: ${p5_price:.2f}\n"
+                 f"• 95th Percentile: ${p95_price:.2f}\n"
+                 f"• 90% Range: ${p5_price:.2f} - ${p95_price:.2f}\n")
     
     # Market bias
     if expected_price > current_price * 1.01:
-        analysis += "\nMARKET BIAS: Bullish\n"
-        analysis += "• PDF peak above current price\n"
+        parts.append("\nMARKET BIAS: Bullish\n"
+                     "• PDF peak above current price\n")
     elif expected_price < current_price * 0.99:
-        analysis += "\nMARKET BIAS: Bearish\n"
-        analysis += "• PDF peak below current price\n"
+        parts.append("\nMARKET BIAS: Bearish\n"
+                     "• PDF peak below current price\n")
     else:
-        analysis += "\nMARKET BIAS: Neutral\n"
-        analysis += "• PDF centered at current price\n"
+        parts.append("\nMARKET BIAS: Neutral\n"
+                     "• PDF centered at current price\n")
     
     # Time considerations
     if days_to_expiry <= 7:
-        analysis += "\nTIME FACTOR:\n"
-        analysis += "• Near expiration - theta decay high\n"
-        analysis += "• Consider 0DTE strategies carefully\n"
+        parts.append("\nTIME FACTOR:\n"
+                     "• Near expiration - theta decay high\n"
+                     "• Consider 0DTE strategies carefully\n")
     elif days_to_expiry <= 30:
-        analysis += "\nTIME FACTOR:\n"
-        analysis += "• Monthly expiration window\n"
-        analysis += "• Moderate theta decay\n"
+        parts.append("\nTIME FACTOR:\n"
+                     "• Monthly expiration window\n"
+                     "• Moderate theta decay\n")
     
-    analysis += "\n\n💡 Tip: Enable AI Analysis for deeper insights!"
+    parts.append("\n\n💡 Tip: Enable AI Analysis for deeper insights!")
     
-    return analysis
+    return ''.join(parts)
+
 
+def _results_fingerprint(results, use_ai):
+    """Cheap hashable fingerprint of the inputs that drive the analysis"""
+    return (
+        results['ticker'], float(results['current_price']), float(results['tau']),
+        hash(results['strikes'].tobytes()), hash(results['IVs'].tobytes()),
+        hash(results['pdf_values'].tobytes()), use_ai
+    )
 
-def analyze(results, use_ai=False):
+
+def _cache_analysis(key, analysis):
+    """Store an analysis text, evicting the least recently used entry"""
+    _ANALYSIS_CACHE[key] = analysis
+    _ANALYSIS_CACHE.move_to_end(key)
+    if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_SIZE:
+        _ANALYSIS_CACHE.popitem(last=False)
+
+
+def analyze(results, use_ai=False, on_chunk=None):
     """
     Main analysis function - routes to AI or basic analysis
     
@@ -319,16 +433,27 @@ def analyze(results, use_ai=False):
         Analysis data
     use_ai : bool
         Whether to use AI analysis
+    on_chunk : callable, optional
+        Receives streamed AI text chunks as they arrive
     
     Returns:
     --------
     str : Analysis text
     """
-    if use_ai and ANTHROPIC_AVAILABLE:
-        ai_result = generate_ai_analysis(results)
-        # If AI fails, fall back to basic
+    use_ai = use_ai and ANTHROPIC_AVAILABLE
+    key = _results_fingerprint(results, use_ai)
+    if key in _ANALYSIS_CACHE:
+        _ANALYSIS_CACHE.move_to_end(key)
+        return _ANALYSIS_CACHE[key]
+    
+    if use_ai:
+        ai_result = generate_ai_analysis(results, on_chunk=on_chunk)
+        # If AI fails, fall back to basic (not cached so the next call retries)
         if ai_result.startswith("❌"):
             return ai_result + "\n\n" + generate_basic_analysis(results)
-        return ai_result
+        analysis = ai_result
     else:
-        return generate_basic_analysis(results)
\ No newline at end of file
+        analysis = generate_basic_analysis(results)
+    
+    _cache_analysis(key, analysis)
+    return analysis
\ No newline at end of file
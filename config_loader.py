@@ -2,6 +2,7 @@
 Simple configuration loader that works in frozen executables
 """
 import os
+import re
 import sys
 
 
@@ -41,44 +42,41 @@ def get_api_key():
     return None
 
 
+# Matches "ANTHROPIC_API_KEY=sk-ant-...", "ANTHROPIC_API_KEY sk-ant-..." or a
+# bare key on its own line; quotes, "export" and a UTF-8 BOM are tolerated
+_KEY_RE = re.compile(
+    rb'^(?:\xef\xbb\xbf)?[ \t]*(?:(?:export[ \t]+)?ANTHROPIC_API_KEY[ \t]*=?[ \t]*)?'
+    rb'["\']?(sk-ant-[^"\'\s]+)',
+    re.M
+)
+
+# Parsed key per path, stored with the (mtime, size) it was read at so
+# unchanged files are not re-read and edits replace the old entry
+_FILE_CACHE = {}
+
+
 def read_key_from_file(filepath):
     """Read API key from a file"""
-    if not os.path.exists(filepath):
+    try:
+        st = os.stat(filepath)
+    except OSError:
         return None
     
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Look for ANTHROPIC_API_KEY
-                if 'ANTHROPIC_API_KEY' in line:
-                    if '=' in line:
-                        # Format: ANTHROPIC_API_KEY=sk-ant-...
-                        key = line.split('=', 1)[1].strip()
-                    else:
-                        # Format: just the key on its own line
-                        key = line.replace('ANTHROPIC_API_KEY', '').strip()
-                    
-                    # Remove quotes if present
-                    key = key.strip('"').strip("'")
-                    
-                    # Validate it looks like a real key
-                    if key and key.startswith('sk-ant-'):
-                        return key
-                
-                # If line starts with sk-ant-, assume it's the key
-                if line.startswith('sk-ant-'):
-                    return line
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _FILE_CACHE.get(filepath)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
     
-    except Exception:
-        pass
+    try:
+        with open(filepath, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
     
-    return None
+    match = _KEY_RE.search(data)
+    key = match.group(1).decode('utf-8', 'replace') if match else None
+    _FILE_CACHE[filepath] = (stamp, key)
+    return key
 
 
 def set_api_key(api_key):
@@ -3,18 +3,171 @@ Extra Features for Options PDF Calculator
 Handles exports, theme switching, and other non-essential features
 """
 
-import os
+import io
+import threading
+import weakref
+import tkinter as tk
+import numpy as np
+from matplotlib import rcParams
+from matplotlib.transforms import BboxBase
 from tkinter import filedialog, messagebox
 from datetime import datetime
+from pathlib import Path
+
+from ui_components import setup_matplotlib_style, style_plot_axes
+
+
+def _ts(dt=None):
+    """Filename timestamp (YYYYMMDD_HHMMSS) without strftime parsing"""
+    if dt is None:
+        dt = datetime.now()
+    return (f"{dt.year:04d}{dt.month:02d}{dt.day:02d}_"
+            f"{dt.hour:02d}{dt.minute:02d}{dt.second:02d}")
+
+
+def show_status(app, message, duration_ms=5000):
+    """Show a transient, non-blocking message in the app's status label
+    
+    Parameters:
+    -----------
+    app : OptionsPDFCalculator
+        Application owning ``status_label`` and ``root``
+    message : str
+        Text to show (prefixed with the status bullet)
+    duration_ms : int
+        Time before the previous status is restored
+    """
+    label = getattr(app, 'status_label', None)
+    if label is None:
+        messagebox.showinfo("Options PDF Calculator", message)
+        return
+    
+    # Back-to-back messages keep the original status as the restore target
+    pending = getattr(app, '_status_revert', None)
+    if pending is not None:
+        app.root.after_cancel(pending[0])
+        previous = pending[1]
+    else:
+        previous = (label.cget('text'), label.cget('foreground'))
+    
+    text = f"● {message}"
+    label.config(text=text)
+    
+    def revert():
+        app._status_revert = None
+        # Leave newer statuses (e.g. "Calculating...") alone
+        if label.cget('text') == text:
+            label.config(text=previous[0], foreground=previous[1])
+    
+    app._status_revert = (app.root.after(duration_ms, revert), previous)
+
+
+def _freeze(value):
+    """Hashable, value-based cache key for savefig keyword arguments"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, BboxBase):
+        return ('bbox', tuple(value.bounds))
+    return value
 
 
 class ExportManager:
     """Handles exporting plots and data"""
     
-    def __init__(self):
-        self.last_export_dir = os.path.expanduser("~")
+    def __init__(self, root=None, notify=None, post=None):
+        self.root = root
+        # Success reporter; defaults to a modal info box
+        self.notify = notify or (lambda message: messagebox.showinfo("Export Successful", message))
+        # Schedules a call on the Tk thread from the writer thread; the app's
+        # _post drops it once the app is closing
+        self.post = post or (lambda func, *args: root.after(0, func, *args))
+        self.last_export_dir = Path.home()
+        # Keyed by the figure itself (weakly), so a new figure that reuses
+        # a collected one's id() never sees its cached output
+        self._render_cache = weakref.WeakKeyDictionary()
+        self._bbox_cache = weakref.WeakKeyDictionary()
+        self._watched_figs = weakref.WeakSet()
+        self._rendering = False
+    
+    def _on_draw(self, event):
+        """Drop cached renders whenever the figure is redrawn"""
+        # savefig draws the figure itself; those draws do not change it
+        if not self._rendering:
+            self._render_cache.clear()
+            self._bbox_cache.clear()
+    
+    def _watch(self, fig):
+        """Connect the cache invalidation handler once per figure"""
+        if fig not in self._watched_figs:
+            fig.canvas.mpl_connect('draw_event', self._on_draw)
+            self._watched_figs.add(fig)
+    
+    def _tight_bbox(self, fig):
+        """Tight bounding box of the figure as drawn on screen
+        
+        Passing a Bbox to savefig skips the extra measuring draw that
+        bbox_inches='tight' performs; cached until the next redraw.
+        """
+        self._watch(fig)
+        bbox = self._bbox_cache.get(fig)
+        if bbox is None:
+            try:
+                renderer = fig.canvas.get_renderer()
+            except AttributeError:
+                return 'tight'
+            bbox = fig.get_tightbbox(renderer).padded(rcParams['savefig.pad_inches'])
+            self._bbox_cache[fig] = bbox
+        return bbox
+    
+    def _render(self, fig, **savefig_kwargs):
+        """Render figure into memory (matplotlib must stay on the main thread)
+        
+        Output is cached per figure, savefig arguments and size until the
+        next redraw, so repeated exports of an unchanged plot skip rendering.
+        """
+        self._watch(fig)
+        renders = self._render_cache.setdefault(fig, {})
+        key = (_freeze(savefig_kwargs), tuple(fig.get_size_inches()))
+        data = renders.get(key)
+        if data is None:
+            buf = io.BytesIO()
+            self._rendering = True
+            try:
+                fig.savefig(buf, **savefig_kwargs)
+            finally:
+                self._rendering = False
+            data = buf.getvalue()
+            renders[key] = data
+        return data
+    
+    def _write_async(self, filepath, data, label):
+        """Write rendered bytes on a daemon thread and report back via Tk
+        
+        Without a root window to post results to, the write is synchronous.
+        """
+        def notify(func, *args):
+            if self.root is not None:
+                self.post(func, *args)
+            else:
+                func(*args)
+        
+        def write():
+            try:
+                with open(filepath, 'wb') as f:
+                    f.write(data)
+                notify(self.notify, f"{label} saved: {Path(filepath).name}")
+            except Exception as e:
+                notify(messagebox.showerror, "Export Error",
+                       f"Failed to export {label.lower()}:\n{str(e)}")
+        
+        if self.root is None:
+            write()
+        else:
+            threading.Thread(target=write, daemon=True).start()
     
-    def export_plot_png(self, fig, ticker):
+    def export_plot_png(self, fig, ticker, dpi=150):
         """Export current plot as PNG
         
         Parameters:
@@ -23,17 +176,19 @@ class ExportManager:
             Figure to export
         ticker : str
             Ticker symbol for filename
+        dpi : int
+            Output resolution (rasterization time scales with pixel count)
         
         Returns:
         --------
         bool : Success status
         """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _ts()
             default_name = f"{ticker}_options_analysis_{timestamp}.png"
             
             filepath = filedialog.asksaveasfilename(
-                initialdir=self.last_export_dir,
+                initialdir=str(self.last_export_dir),
                 title="Export Plot as PNG",
                 defaultextension=".png",
                 initialfile=default_name,
@@ -41,11 +196,13 @@ class ExportManager:
             )
             
             if filepath:
-                fig.savefig(filepath, dpi=300, bbox_inches='tight', 
-                           facecolor=fig.get_facecolor())
-                self.last_export_dir = os.path.dirname(filepath)
-                messagebox.showinfo("Export Successful", 
-                                  f"Plot saved to:\n{filepath}")
+                # Fastest zlib level: PNG is lossless, only file size changes
+                data = self._render(fig, format='png', dpi=dpi,
+                                    bbox_inches=self._tight_bbox(fig),
+                                    facecolor=fig.get_facecolor(),
+                                    pil_kwargs={'optimize': False, 'compress_level': 1})
+                self.last_export_dir = Path(filepath).parent
+                self._write_async(filepath, data, "Plot")
                 return True
             return False
             
@@ -68,11 +225,11 @@ class ExportManager:
         bool : Success status
         """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _ts()
             default_name = f"{ticker}_options_analysis_{timestamp}.pdf"
             
             filepath = filedialog.asksaveasfilename(
-                initialdir=self.last_export_dir,
+                initialdir=str(self.last_export_dir),
                 title="Export Plot as PDF",
                 defaultextension=".pdf",
                 initialfile=default_name,
@@ -80,11 +237,13 @@ class ExportManager:
             )
             
             if filepath:
-                fig.savefig(filepath, format='pdf', bbox_inches='tight',
-                           facecolor=fig.get_facecolor())
-                self.last_export_dir = os.path.dirname(filepath)
-                messagebox.showinfo("Export Successful", 
-                                  f"Plot saved to:\n{filepath}")
+                # PDF is vector output, so no DPI is involved
+                data = self._render(fig, format='pdf', backend='pdf',
+                                    bbox_inches=self._tight_bbox(fig),
+                                    facecolor=fig.get_facecolor(),
+                                    metadata={'Creator': 'OptionsPDFCalc'})
+                self.last_export_dir = Path(filepath).parent
+                self._write_async(filepath, data, "Plot")
                 return True
             return False
             
@@ -108,43 +267,63 @@ class ExportManager:
             import csv
             
             ticker = results.get('ticker', 'UNKNOWN')
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            default_name = f"{ticker}_data_{timestamp}.csv"
+            now = datetime.now()
+            default_name = f"{ticker}_data_{_ts(now)}.csv"
             
             filepath = filedialog.asksaveasfilename(
-                initialdir=self.last_export_dir,
+                initialdir=str(self.last_export_dir),
                 title="Export Data as CSV",
                 defaultextension=".csv",
                 initialfile=default_name,
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+                filetypes=[("CSV files", "*.csv"), ("Compressed CSV files", "*.csv.gz"),
+                           ("All files", "*.*")]
             )
             
             if filepath:
-                with open(filepath, 'w', newline='') as f:
+                # Large buffer amortizes write syscalls on network drives;
+                # .gz paths are compressed on the fly at the fastest level
+                if filepath.lower().endswith('.gz'):
+                    import gzip
+                    f = gzip.open(filepath, 'wt', compresslevel=1,
+                                  newline='', encoding='utf-8')
+                else:
+                    f = open(filepath, 'w', newline='', buffering=1024 * 1024,
+                             encoding='utf-8')
+                
+                with f:
                     writer = csv.writer(f)
+                    _write = writer.writerow  # bound once for the header rows
                     
                     # Header
-                    writer.writerow([f"Options Analysis Data for {ticker}"])
-                    writer.writerow([f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"])
-                    writer.writerow([])
+                    _write((f"Options Analysis Data for {ticker}",))
+                    _write((f"Generated: {now:%Y-%m-%d %H:%M:%S}",))
+                    _write(())
                     
                     # IV Smile Data
-                    writer.writerow(["Implied Volatility Smile"])
-                    writer.writerow(["Strike", "Implied Volatility (%)"])
-                    for strike, iv in zip(results['strikes'], results['IVs']):
-                        writer.writerow([f"{strike:.2f}", f"{iv*100:.2f}"])
+                    _write(("Implied Volatility Smile",))
+                    _write(("Strike", "Implied Volatility (%)"))
+                    # Scale once in C; tolist() yields Python floats, which
+                    # format faster than NumPy scalars
+                    ivs_pct = np.multiply(results['IVs'], 100.0)
+                    writer.writerows(
+                        (f"{strike:.2f}", f"{iv:.2f}")
+                        for strike, iv in zip(np.asarray(results['strikes']).tolist(),
+                                              ivs_pct.tolist())
+                    )
                     
-                    writer.writerow([])
+                    _write(())
                     
                     # PDF Data
-                    writer.writerow(["Probability Density Function"])
-                    writer.writerow(["Price", "Probability Density"])
-                    for price, prob in zip(results['pdf_strikes'], results['pdf_values']):
-                        writer.writerow([f"{price:.2f}", f"{prob:.6f}"])
+                    _write(("Probability Density Function",))
+                    _write(("Price", "Probability Density"))
+                    writer.writerows(
+                        (f"{price:.2f}", f"{prob:.6f}")
+                        for price, prob in zip(np.asarray(results['pdf_strikes']).tolist(),
+                                               np.asarray(results['pdf_values']).tolist())
+                    )
                 
-                self.last_export_dir = os.path.dirname(filepath)
-                messagebox.showinfo("Export Successful", 
-                                  f"Data saved to:\n{filepath}")
+                self.last_export_dir = Path(filepath).parent
+                self.notify(f"Data saved: {Path(filepath).name}")
                 return True
             return False
             
@@ -156,39 +335,46 @@ class ExportManager:
 class ThemeSwitcher:
     """Handles theme switching and custom themes"""
     
+    # Theme and chart color keys used by the window and the plots
+    THEME_KEYS = ('bg', 'fg', 'panel', 'input', 'border')
+    CHART_KEYS = ('market', 'fit', 'current', 'pdf', 'grid')
+    
+    # Theme keys read by the figure (see _restyle_plot and style_plot_axes)
+    PLOT_KEYS = frozenset(('fg', 'panel', 'input', 'border'))
+    
     def __init__(self, app):
         self.app = app
+        self._theme_cache = {}
+    
+    def _resolve_colors(self):
+        """Resolve the current mode's colors once and cache them"""
+        theme = self.app.theme
+        colors = self._theme_cache.get(theme.mode)
+        if colors is None:
+            colors = {key: theme.get_color(key) for key in self.THEME_KEYS}
+            colors.update({key: theme.get_chart_color(key) for key in self.CHART_KEYS})
+            self._theme_cache[theme.mode] = colors
+        return colors
     
     def toggle_theme(self):
         """Toggle between dark and light mode"""
         # Toggle theme manager
         new_mode = self.app.theme.toggle_mode()
+        colors = self._resolve_colors()
         
-        # Reconfigure all styles
+        # Reconfigure all styles (StyleConfigurator skips unchanged ones)
         self.app.style_config.configure_all()
+        self.app.root.configure(bg=colors['bg'])
         
-        # Update root background
-        self.app.root.configure(bg=self.app.theme.get_color('bg'))
-        
-        # Update matplotlib
-        from ui_components import setup_matplotlib_style
+        # Update matplotlib and the app's cached plot colors
         setup_matplotlib_style(self.app.theme)
+        self.app.refresh_colors()
         
-        # Re-plot if results exist
-        if self.app.last_results:
-            self.app.plot_results(
-                self.app.last_results['strikes'],
-                self.app.last_results['IVs'],
-                self.app.last_results['smooth_strikes'],
-                self.app.last_results['fitted_IVs'],
-                self.app.last_results['pdf_strikes'],
-                self.app.last_results['pdf_values'],
-                self.app.last_results['current_price'],
-                self.app.last_results['ticker']
-            )
+        # Restyle existing plot in place
+        self._refresh_plot(colors)
         
         mode_name = "Light" if new_mode == "light" else "Dark"
-        messagebox.showinfo("Theme Changed", f"Switched to {mode_name} mode!")
+        show_status(self.app, f"Switched to {mode_name} mode")
     
     def apply_custom_colors(self, color_dict):
         """Apply custom color scheme
@@ -198,16 +384,31 @@ class ThemeSwitcher:
         color_dict : dict
             Dictionary with color values for different elements
         """
-        # Update theme colors
+        # Update theme colors, remembering which ones actually changed
+        changed = set()
         for key, value in color_dict.items():
             if key in self.app.theme.current_theme:
+                if self.app.theme.current_theme[key] != value:
+                    changed.add(key)
                 self.app.theme.current_theme[key] = value
         
+        # Cached colors for this mode are stale now
+        self._theme_cache.pop(self.app.theme.mode, None)
+        colors = self._resolve_colors()
+        
         # Reconfigure styles
         self.app.style_config.configure_all()
+        self.app.refresh_colors()
         
-        # Update display
-        if self.app.last_results:
+        # Update display only if a color used by the figure changed
+        if changed & self.PLOT_KEYS:
+            self._refresh_plot(colors)
+    
+    def _refresh_plot(self, colors):
+        """Restyle plot artists in place, replotting only if there are none"""
+        if not self.app.last_results:
+            return
+        if not self._restyle_plot(colors):
             self.app.plot_results(
                 self.app.last_results['strikes'],
                 self.app.last_results['IVs'],
@@ -218,14 +419,51 @@ class ThemeSwitcher:
                 self.app.last_results['current_price'],
                 self.app.last_results['ticker']
             )
+    
+    def _restyle_plot(self, colors):
+        """Update colors of the existing plot artists without rebuilding them
+        
+        Returns:
+        --------
+        bool : False if there are no artist handles to restyle
+        """
+        artists = getattr(self.app, 'plot_artists', None)
+        if not artists:
+            return False
+        
+        self.app.fig.set_facecolor(colors['panel'])
+        artists['market'].set_facecolor(colors['market'])
+        artists['fit'].set_color(colors['fit'])
+        artists['pdf_fill'].set_color(colors['pdf'])
+        artists['pdf_line'].set_color(colors['pdf'])
+        for line in artists['current']:
+            line.set_color(colors['current'])
+        
+        for ax in (self.app.ax1, self.app.ax2):
+            ax.set_facecolor(colors['input'])
+            ax.title.set_color(colors['fg'])
+            ax.xaxis.label.set_color(colors['fg'])
+            ax.yaxis.label.set_color(colors['fg'])
+            # Legend entries copy artist colors, so rebuild the (cheap) legend
+            ax.legend(fontsize=10)
+            style_plot_axes(ax, self.app.theme)
+        
+        self.app.canvas.draw_idle()
+        return True
 
 
 class FontSizeController:
     """Controls application font sizes"""
     
-    def __init__(self, font_manager):
+    # Delay before applying a size change, so held-down shortcuts coalesce
+    DEBOUNCE_MS = 50
+    
+    def __init__(self, font_manager, root=None):
         self.fonts = font_manager
+        self.root = root
         self.base_size = 12  # Updated to match new default
+        self._applied_size = self.base_size
+        self._pending_update = None
     
     def increase_size(self):
         """Increase all font sizes"""
@@ -244,7 +482,27 @@ class FontSizeController:
         self._update_fonts()
     
     def _update_fonts(self):
-        """Update all font objects"""
+        """Schedule a font update, coalescing rapid size changes
+        
+        Without a root window the update is applied immediately.
+        """
+        if self.root is None:
+            self._flush_update()
+            return
+        if self._pending_update is not None:
+            self.root.after_cancel(self._pending_update)
+        self._pending_update = self.root.after(self.DEBOUNCE_MS, self._flush_update)
+    
+    def _flush_update(self):
+        """Update all font objects
+        
+        Only Tk fonts change here; the matplotlib canvas is never redrawn.
+        Sizes already applied are skipped to avoid a no-op Tk re-layout.
+        """
+        self._pending_update = None
+        if self.base_size == self._applied_size:
+            return
+        self._applied_size = self.base_size
         try:
             self.fonts.title_font.configure(size=self.base_size - 1)  # Title stays smaller
             self.fonts.normal_font.configure(size=self.base_size)
@@ -257,6 +515,27 @@ class FontSizeController:
 class FeatureMenu:
     """Creates menu bar with extra features"""
     
+    # Menu entries as (label, command attribute path); None adds a separator
+    FILE_ITEMS = (
+        ("Export Plot as PNG", 'export_png'),
+        ("Export Plot as PDF", 'export_pdf'),
+        ("Export Data as CSV", 'export_csv'),
+        None,
+        ("Quit", 'app.safe_quit'),
+    )
+    VIEW_ITEMS = (
+        ("Toggle Dark/Light Mode", 'theme_switcher.toggle_theme'),
+        None,
+        ("Increase Font Size", 'increase_font'),
+        ("Decrease Font Size", 'decrease_font'),
+        ("Reset Font Size", 'font_controller.reset_size'),
+    )
+    HELP_ITEMS = (
+        ("About", 'show_about'),
+        ("Keyboard Shortcuts", 'show_shortcuts'),
+    )
+    MENUS = (("File", FILE_ITEMS), ("View", VIEW_ITEMS), ("Help", HELP_ITEMS))
+    
     def __init__(self, root, app):
         self.root = root
         self.app = app
@@ -264,9 +543,10 @@ class FeatureMenu:
         root.config(menu=self.menubar)
         
         # Initialize managers
-        self.export_manager = ExportManager()
+        self.export_manager = ExportManager(root, lambda message: show_status(app, message),
+                                            post=app._post)
         self.theme_switcher = ThemeSwitcher(app)
-        self.font_controller = FontSizeController(app.fonts)
+        self.font_controller = FontSizeController(app.fonts, root)
         
         self.create_menus()
         self.bind_shortcuts()
@@ -276,37 +556,18 @@ class FeatureMenu:
         # Configure menu font size
         menu_font = ('Segoe UI', 11)  # Increased from default
         
-        # File menu
-        file_menu = tk.Menu(self.menubar, tearoff=0, font=menu_font)
-        self.menubar.add_cascade(label="File", menu=file_menu, font=menu_font)
-        file_menu.add_command(label="Export Plot as PNG", 
-                            command=self.export_png)
-        file_menu.add_command(label="Export Plot as PDF", 
-                            command=self.export_pdf)
-        file_menu.add_command(label="Export Data as CSV", 
-                            command=self.export_csv)
-        file_menu.add_separator()
-        file_menu.add_command(label="Quit", command=self.app.safe_quit)
-        
-        # View menu
-        view_menu = tk.Menu(self.menubar, tearoff=0, font=menu_font)
-        self.menubar.add_cascade(label="View", menu=view_menu, font=menu_font)
-        view_menu.add_command(label="Toggle Dark/Light Mode", 
-                            command=self.theme_switcher.toggle_theme)
-        view_menu.add_separator()
-        view_menu.add_command(label="Increase Font Size", 
-                            command=self.increase_font)
-        view_menu.add_command(label="Decrease Font Size", 
-                            command=self.decrease_font)
-        view_menu.add_command(label="Reset Font Size", 
-                            command=self.font_controller.reset_size)
-        
-        # Help menu
-        help_menu = tk.Menu(self.menubar, tearoff=0, font=menu_font)
-        self.menubar.add_cascade(label="Help", menu=help_menu, font=menu_font)
-        help_menu.add_command(label="About", command=self.show_about)
-        help_menu.add_command(label="Keyboard Shortcuts", 
-                            command=self.show_shortcuts)
+        for menu_label, items in self.MENUS:
+            menu = tk.Menu(self.menubar, tearoff=0, font=menu_font)
+            self.menubar.add_cascade(label=menu_label, menu=menu, font=menu_font)
+            for item in items:
+                if item is None:
+                    menu.add_separator()
+                    continue
+                label, path = item
+                command = self
+                for attr in path.split('.'):
+                    command = getattr(command, attr)
+                menu.add_command(label=label, command=command)
     
     def export_png(self):
         """Export plot as PNG"""
@@ -338,16 +599,12 @@ class FeatureMenu:
     def increase_font(self):
         """Increase font size"""
         self.font_controller.increase_size()
-        # Update status label if available
-        if hasattr(self.app, 'status_label'):
-            self.app.status_label.config(text=f"● Font: {self.font_controller.base_size}pt")
+        show_status(self.app, f"Font: {self.font_controller.base_size}pt")
     
     def decrease_font(self):
         """Decrease font size"""
         self.font_controller.decrease_size()
-        # Update status label if available
-        if hasattr(self.app, 'status_label'):
-            self.app.status_label.config(text=f"● Font: {self.font_controller.base_size}pt")
+        show_status(self.app, f"Font: {self.font_controller.base_size}pt")
     
     def show_about(self):
         """Show about dialog"""
@@ -399,6 +656,3 @@ Ctrl+0 - Reset Font"""
         self.root.bind('<Control-equal>', lambda e: self.increase_font())  # For convenience (no shift needed)
         self.root.bind('<Control-minus>', lambda e: self.decrease_font())
         self.root.bind('<Control-0>', lambda e: self.font_controller.reset_size())
-
-
-import tkinter as tk
\ No newline at end of file
@@ -0,0 +1,192 @@
+"""
+Metrics Kernel for Options PDF Calculator
+Single-pass extraction of IV smile and PDF metrics used by the analysis module
+"""
+
+import numpy as np
+
+# Check if Numba is available
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _metrics_loop(strikes, IVs, pdf_strikes, pdf_values, current_price, dx):
+    """Fused metrics loop - streams through each array exactly once"""
+    put_cut = current_price * 0.95
+    call_cut = current_price * 1.05
+
+    # IV smile pass: ATM strike, IV range and OTM put/call sums
+    atm_idx = 0
+    best_dist = abs(strikes[0] - current_price)
+    max_iv = IVs[0]
+    min_iv = IVs[0]
+    put_sum = 0.0
+    put_count = 0
+    call_sum = 0.0
+    call_count = 0
+
+    for i in range(strikes.shape[0]):
+        strike = strikes[i]
+        iv = IVs[i]
+
+        dist = abs(strike - current_price)
+        if dist < best_dist:
+            best_dist = dist
+            atm_idx = i
+
+        if iv > max_iv:
+            max_iv = iv
+        if iv < min_iv:
+            min_iv = iv
+
+        if strike < put_cut:
+            put_sum += iv
+            put_count += 1
+        elif strike > call_cut:
+            call_sum += iv
+            call_count += 1
+
+    # IVs are strictly positive, so 0.0 marks an empty OTM wing
+    put_avg = put_sum / put_count if put_count > 0 else 0.0
+    call_avg = call_sum / call_count if call_count > 0 else 0.0
+
+    # PDF pass: peak and first crossings of the 5th/95th percentiles
+    n = pdf_values.shape[0]
+    peak_idx = 0
+    peak = pdf_values[0]
+    cumulative = 0.0
+    p5_idx = -1
+    p95_idx = -1
+
+    # Running sum replaces a cumsum array; stop accumulating once the 95th
+    # percentile is found and only track the peak for the remaining tail
+    i = 0
+    while i < n:
+        value = pdf_values[i]
+        if value > peak:
+            peak = value
+            peak_idx = i
+
+        # dx > 0 marks a uniform grid; otherwise integrate by trapezoids
+        if dx > 0.0:
+            cumulative += value * dx
+        elif i > 0:
+            cumulative += (0.5 * (value + pdf_values[i - 1])
+                           * (pdf_strikes[i] - pdf_strikes[i - 1]))
+        if p5_idx < 0 and cumulative >= 0.05:
+            p5_idx = i
+        if cumulative >= 0.95:
+            p95_idx = i
+            break
+        i += 1
+
+    for j in range(i + 1, n):
+        if pdf_values[j] > peak:
+            peak = pdf_values[j]
+            peak_idx = j
+
+    # Truncated PDFs may never reach a percentile; use the last point
+    if p5_idx < 0:
+        p5_idx = n - 1
+    if p95_idx < 0:
+        p95_idx = n - 1
+
+    return (IVs[atm_idx], max_iv, min_iv, put_avg, call_avg,
+            peak_idx, p5_idx, p95_idx)
+
+
+def _metrics_numpy(strikes, IVs, pdf_strikes, pdf_values, current_price, dx):
+    """NumPy fallback used when Numba is not installed (strikes ascending)"""
+    # Strikes come sorted from the option chain: binary search, then pick
+    # the closer neighbour (ties go to the lower strike, as argmin did)
+    j = np.searchsorted(strikes, current_price)
+    if j == 0:
+        atm_idx = 0
+    elif j == len(strikes):
+        atm_idx = len(strikes) - 1
+    elif abs(strikes[j] - current_price) < abs(strikes[j - 1] - current_price):
+        atm_idx = j
+    else:
+        atm_idx = j - 1
+
+    # NumPy has no fused min/max; ndarray methods skip the np.min/np.max
+    # dispatch layer (the Numba kernel gets both in its single pass)
+    min_iv = IVs.min()
+    max_iv = IVs.max()
+
+    # Masked means avoid gathering the OTM wings into copies
+    put_mask = strikes < current_price * 0.95
+    call_mask = strikes > current_price * 1.05
+    put_avg = np.mean(IVs, where=put_mask) if put_mask.any() else 0.0
+    call_avg = np.mean(IVs, where=call_mask) if call_mask.any() else 0.0
+
+    peak_idx = np.argmax(pdf_values)
+
+    # CDF is non-decreasing, so a binary search finds both crossings
+    if dx > 0:
+        cumulative = np.cumsum(pdf_values)
+        cumulative *= dx
+    else:
+        cumulative = np.zeros_like(pdf_values)
+        np.cumsum(0.5 * (pdf_values[1:] + pdf_values[:-1]) * np.diff(pdf_strikes),
+                  out=cumulative[1:])
+    p5_idx, p95_idx = np.minimum(np.searchsorted(cumulative, (0.05, 0.95)),
+                                 len(cumulative) - 1)
+
+    return (IVs[atm_idx], max_iv, min_iv, put_avg, call_avg,
+            peak_idx, p5_idx, p95_idx)
+
+
+# Explicit signature compiles eagerly at import instead of on the first
+# analysis; cache=True persists the machine code across launches
+_METRICS_SIGNATURE = "Tuple((f8,f8,f8,f8,f8,i8,i8,i8))(f8[:],f8[:],f8[:],f8[:],f8,f8)"
+
+_metrics_kernel = _metrics_numpy
+if NUMBA_AVAILABLE:
+    try:
+        _metrics_kernel = njit(_METRICS_SIGNATURE, cache=True,
+                               fastmath=True)(_metrics_loop)
+    except Exception:
+        # Compilation or cache setup can fail (e.g. read-only frozen
+        # bundle); the NumPy path gives identical results
+        pass
+
+
+def compute_metrics(strikes, IVs, pdf_strikes, pdf_values, current_price):
+    """
+    Compute all IV smile and PDF metrics in a single fused pass
+
+    Parameters:
+    -----------
+    strikes, IVs : array-like
+        Market strikes and implied volatilities (as fractions)
+    pdf_strikes, pdf_values : array-like
+        Price grid and risk-neutral density values
+    current_price : float
+        Current underlying price
+
+    Returns:
+    --------
+    tuple : (atm_iv, max_iv, min_iv, put_avg, call_avg,
+             peak_idx, p5_idx, p95_idx)
+        IV values are fractions; put_avg/call_avg are 0.0 when the
+        corresponding OTM wing has no strikes
+    """
+    pdf_strikes = np.ascontiguousarray(pdf_strikes, dtype=np.float64)
+    
+    # Check grid spacing once; non-uniform grids use trapezoidal sums
+    dx = pdf_strikes[1] - pdf_strikes[0]
+    if not np.allclose(np.diff(pdf_strikes), dx):
+        dx = 0.0
+    
+    return _metrics_kernel(
+        np.ascontiguousarray(strikes, dtype=np.float64),
+        np.ascontiguousarray(IVs, dtype=np.float64),
+        pdf_strikes,
+        np.ascontiguousarray(pdf_values, dtype=np.float64),
+        float(current_price),
+        float(dx)
+    )
@@ -3,17 +3,25 @@ Options-Derived Probability Density Function Calculator
 Core calculation engine with clean UI separation
 """
 
+import math
+import os
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import yfinance as yf
-from scipy.optimize import minimize
-from scipy.stats import norm
+from scipy.optimize import least_squares, minimize
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+import time
 import warnings
 import re
+
+import pricing
 warnings.filterwarnings('ignore')
 
 # Import modules
@@ -41,10 +49,131 @@ except ImportError:
     FEATURES_AVAILABLE = False
     print("Note: features.py not found. Advanced features disabled.")
 
+# **bold** markup in analysis text
+_BOLD_RE = re.compile(r'(\*\*.*?\*\*)')
+
+# Check if Numba is available
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _svi_variance_loop(k, a, b, rho, m, sigma):
+    """Fused SVI total variance - no k-m / sqrt temporaries"""
+    out = np.empty_like(k)
+    sigma2 = sigma*sigma
+    for i in range(k.shape[0]):
+        km = k[i] - m
+        out[i] = a + b*(rho*km + math.sqrt(km*km + sigma2))
+    return out
+
+
+def _svi_residual_loop(k, var, a, b, rho, m, sigma):
+    """Fused SVI residual (model minus observed total variance)"""
+    out = np.empty_like(k)
+    sigma2 = sigma*sigma
+    for i in range(k.shape[0]):
+        km = k[i] - m
+        out[i] = a + b*(rho*km + math.sqrt(km*km + sigma2)) - var[i]
+    return out
+
+
+def _svi_sse_loop(k, var, a, b, rho, m, sigma):
+    """Fused SVI sum of squared residuals - no residual array at all"""
+    sigma2 = sigma*sigma
+    sse = 0.0
+    for i in range(k.shape[0]):
+        km = k[i] - m
+        res = a + b*(rho*km + math.sqrt(km*km + sigma2)) - var[i]
+        sse += res*res
+    return sse
+
+
+def _svi_sse_grad_loop(k, var, a, b, rho, m, sigma):
+    """Fused SVI sum of squares and its gradient w.r.t. (a, b, rho, m, sigma)"""
+    grad = np.zeros(5)
+    sigma2 = sigma*sigma
+    sse = 0.0
+    for i in range(k.shape[0]):
+        km = k[i] - m
+        root = math.sqrt(km*km + sigma2)
+        res = a + b*(rho*km + root) - var[i]
+        sse += res*res
+        res2 = 2.0*res
+        grad[0] += res2
+        grad[1] += res2*(rho*km + root)
+        grad[2] += res2*b*km
+        grad[3] -= res2*b*(rho + km/root)
+        grad[4] += res2*b*sigma/root
+    return sse, grad
+
+
+# Explicit signatures compile at import, so the first calibration does not
+# pay the JIT cost; cache=True keeps the machine code across launches and
+# nogil lets the multi-start fits in fit_svi evaluate concurrently
+_svi_variance_kernel = None
+_svi_residual_kernel = None
+_svi_sse_kernel = None
+_svi_sse_grad_kernel = None
+if NUMBA_AVAILABLE:
+    try:
+        _svi_variance_kernel = njit("f8[:](f8[:],f8,f8,f8,f8,f8)",
+                                    cache=True, fastmath=True, nogil=True)(_svi_variance_loop)
+        _svi_residual_kernel = njit("f8[:](f8[:],f8[:],f8,f8,f8,f8,f8)",
+                                    cache=True, fastmath=True, nogil=True)(_svi_residual_loop)
+        _svi_sse_kernel = njit("f8(f8[:],f8[:],f8,f8,f8,f8,f8)",
+                               cache=True, fastmath=True, nogil=True)(_svi_sse_loop)
+        _svi_sse_grad_kernel = njit("Tuple((f8,f8[:]))(f8[:],f8[:],f8,f8,f8,f8,f8)",
+                                    cache=True, fastmath=True, nogil=True)(_svi_sse_grad_loop)
+    except Exception:
+        # Fall back to NumPy (e.g. read-only cache dir in a frozen bundle)
+        _svi_variance_kernel = _svi_residual_kernel = None
+        _svi_sse_kernel = _svi_sse_grad_kernel = None
+
+
+def _take_all(q):
+    """Remove and return everything currently in a queue.Queue"""
+    items = []
+    try:
+        while True:
+            items.append(q.get_nowait())
+    except queue.Empty:
+        return items
+
+
+@lru_cache(maxsize=64)
+def _parse_expiry(expiry):
+    """Parse a yfinance YYYY-MM-DD expiration (C ISO parser, cached per string)"""
+    return datetime.fromisoformat(expiry)
+
+
+def _is_float_vector(x):
+    """True for 1-D float64 arrays, the only input the kernels accept"""
+    return isinstance(x, np.ndarray) and x.ndim == 1 and x.dtype == np.float64
+
 
 class OptionsPDFCalculator:
     """Main application class - focuses on calculations"""
     
+    # Seconds fetched market data is reused for repeat calculations, and
+    # how many tickers/chains each cache keeps (least recently used go first)
+    CACHE_TTL = 60
+    CACHE_SIZE = 32
+    
+    # Milliseconds between drains of worker log messages during a run
+    LOG_DRAIN_MS = 100
+    
+    # Milliseconds between repaints while analysis text streams in (20 Hz)
+    STREAM_DRAIN_MS = 50
+    
+    # Plot colors used when the UI module (and its ThemeManager) is missing
+    DEFAULT_PLOT_COLORS = {
+        'fg': '#e6edf3', 'panel': '#161b22', 'input': '#21262d',
+        'market': '#58a6ff', 'fit': '#f85149', 'current': '#3fb950', 'pdf': '#bc8cff',
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Options PDF Calculator - SVI Method")
@@ -59,6 +188,7 @@ class OptionsPDFCalculator:
             self.style_config.configure_all()
             self.root.configure(bg=self.theme.get_color('bg'))
             setup_matplotlib_style(self.theme)
+        self.refresh_colors()
         
         # Window close handler
         self.root.protocol("WM_DELETE_WINDOW", self.safe_quit)
@@ -66,6 +196,20 @@ class OptionsPDFCalculator:
         # State
         self.use_ai = tk.BooleanVar(value=False)
         self.last_results = None
+        self._ticker_cache = {}
+        self._chain_cache = {}
+        
+        # Calculations run off the Tk thread; their log lines are queued
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._calc_future = None
+        self._log_queue = queue.Queue()
+        self._chunk_queue = queue.Queue()
+        # Set by safe_quit; workers stop posting results to the root
+        self._closing = False
+        # Separate pools for work the calc worker submits and then waits on,
+        # so it never blocks on a slot in its own pool
+        self._fit_executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+        self._io_executor = ThreadPoolExecutor(max_workers=2)
         
         # Create UI
         self.create_interface()
@@ -162,7 +306,6 @@ class OptionsPDFCalculator:
     def on_ai_toggle(self):
         """Handle AI toggle"""
         if self.use_ai.get():
-            import os
             if not os.environ.get("ANTHROPIC_API_KEY"):
                 messagebox.showwarning(
                     "API Key Not Found",
@@ -211,31 +354,72 @@ class OptionsPDFCalculator:
                                     padding=15, style=style)
         plot_frame.pack(fill="both", expand=True, padx=8, pady=8)
         
-        if UI_MODULE_AVAILABLE:
-            facecolor = self.theme.get_color('panel')
-            subplot_color = self.theme.get_color('input')
-        else:
-            facecolor = '#161b22'
-            subplot_color = '#21262d'
-        
-        self.fig = Figure(figsize=(11, 9), facecolor=facecolor, dpi=100)
-        self.ax1 = self.fig.add_subplot(211, facecolor=subplot_color)
-        self.ax2 = self.fig.add_subplot(212, facecolor=subplot_color)
+        colors = self._colors
+        self.fig = Figure(figsize=(11, 9), facecolor=colors['panel'], dpi=100)
+        self.ax1 = self.fig.add_subplot(211, facecolor=colors['input'])
+        self.ax2 = self.fig.add_subplot(212, facecolor=colors['input'])
         
         self.canvas = FigureCanvasTkAgg(self.fig, master=plot_frame)
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        
+        # Data artist handles (filled by plot_results) for in-place restyling
+        self.plot_artists = {}
+    
+    def refresh_colors(self):
+        """Re-read the plot colors from the theme (call after a theme change)"""
+        if not UI_MODULE_AVAILABLE:
+            self._colors = self.DEFAULT_PLOT_COLORS
+            return
+        self._colors = {key: self.theme.get_color(key)
+                        for key in ('fg', 'panel', 'input')}
+        self._colors.update({key: self.theme.get_chart_color(key)
+                             for key in ('market', 'fit', 'current', 'pdf')})
     
     def safe_quit(self):
         """Quit application"""
         if messagebox.askokcancel("Quit", "Quit application?"):
+            self._closing = True
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._fit_executor.shutdown(wait=False, cancel_futures=True)
+            self._io_executor.shutdown(wait=False, cancel_futures=True)
             self.root.quit()
             self.root.destroy()
     
+    def _post(self, func, *args):
+        """Run func on the Tk thread soon (safe from any thread)
+        
+        Dropped once the app is closing, so a worker finishing after
+        root.destroy() does not raise inside its done-callback.
+        """
+        if self._closing:
+            return
+        try:
+            self.root.after(0, func, *args)
+        except (RuntimeError, tk.TclError):
+            pass  # Root destroyed between the check and the call
+    
     def log(self, message):
-        """Log to optimization output"""
-        self.output_text.insert(tk.END, message + "\n")
-        self.output_text.see(tk.END)
-        self.root.update()
+        """Log to optimization output (safe from any thread)
+        
+        Messages go through a queue; the main thread writes them out at
+        once, worker messages appear at the next _drain_log.
+        """
+        self._log_queue.put(message)
+        if threading.current_thread() is threading.main_thread():
+            self._flush_log()
+    
+    def _flush_log(self):
+        """Write all queued log messages in one insert (Tk main thread)"""
+        messages = _take_all(self._log_queue)
+        if messages:
+            self.output_text.insert(tk.END, "\n".join(messages) + "\n")
+            self.output_text.see(tk.END)
+    
+    def _drain_log(self):
+        """Show worker progress every LOG_DRAIN_MS while a calculation runs"""
+        self._flush_log()
+        if self._calc_future is not None and not self._calc_future.done():
+            self.root.after(self.LOG_DRAIN_MS, self._drain_log)
     
     def log_analysis(self, message):
         """Log to analysis output with bold support"""
@@ -243,7 +427,7 @@ class OptionsPDFCalculator:
         self.analysis_text.delete(1.0, tk.END)
         
         # Parse **bold** syntax
-        parts = re.split(r'(\*\*.*?\*\*)', message)
+        parts = _BOLD_RE.split(message)
         for part in parts:
             if part.startswith('**') and part.endswith('**'):
                 self.analysis_text.insert(tk.END, part[2:-2], "bold")
@@ -251,190 +435,492 @@ class OptionsPDFCalculator:
                 self.analysis_text.insert(tk.END, part)
         
         self.analysis_text.see(tk.END)
-        self.root.update()
+    
+    def stream_analysis(self, chunk):
+        """Append a streamed analysis chunk as plain text (Tk main thread)"""
+        self.analysis_text.config(state=tk.NORMAL)
+        self.analysis_text.insert(tk.END, chunk)
+        self.analysis_text.see(tk.END)
+    
+    def _drain_analysis(self):
+        """Append queued analysis chunks every STREAM_DRAIN_MS while streaming
+        
+        One insert per drain instead of one event and repaint per chunk.
+        """
+        chunks = _take_all(self._chunk_queue)
+        if chunks:
+            self.stream_analysis(''.join(chunks))
+        if not self._closing and not self._calc_future.done():
+            self.root.after(self.STREAM_DRAIN_MS, self._drain_analysis)
+    
+    # ==================== DATA FETCHING ====================
+    
+    def _cached(self, cache, key, fetch):
+        """Return cache[key] if younger than CACHE_TTL, else fetch and store it
+        
+        Dict order doubles as recency: hits move to the end and the front
+        entry is evicted past CACHE_SIZE.
+        """
+        now = time.monotonic()
+        entry = cache.pop(key, None)
+        if entry is not None and now - entry[0] < self.CACHE_TTL:
+            cache[key] = entry
+            return entry[1]
+        value = fetch()
+        cache[key] = (now, value)
+        if len(cache) > self.CACHE_SIZE:
+            del cache[next(iter(cache))]
+        return value
+    
+    def _fetch_ticker(self, ticker):
+        """Fetch ticker object, current price and expirations from Yahoo
+        
+        The expirations request runs on the I/O pool while the price is
+        fetched here.
+        """
+        stock = yf.Ticker(ticker)
+        expirations = self._io_executor.submit(lambda: stock.options)
+        # fast_info reads the quote endpoint only, unlike the full info
+        # metadata download; it fetches lazily and can raise for bad symbols
+        try:
+            current_price = stock.fast_info.get('last_price')
+        except Exception:
+            current_price = None
+        if current_price is None or not np.isfinite(current_price):
+            hist = stock.history(period='1d')
+            if hist.empty:
+                raise ValueError("Ticker not found")
+            current_price = hist['Close'].iloc[-1]
+        return stock, current_price, expirations.result()
+    
+    def _get_ticker(self, ticker):
+        """Cached (stock, current_price, expirations) for a ticker"""
+        return self._cached(self._ticker_cache, ticker,
+                            lambda: self._fetch_ticker(ticker))
+    
+    def _fetch_chain(self, ticker, expiry):
+        """Fetch the call chain and reduce it to liquid (strikes, mid_prices)
+        
+        Returns read-only arrays sorted by strike, so cached results cannot
+        be modified in place by later calculations.
+        """
+        calls = self._get_ticker(ticker)[0].option_chain(expiry).calls
+        strike = calls['strike'].to_numpy(dtype=float)
+        bid = calls['bid'].to_numpy(dtype=float)
+        ask = calls['ask'].to_numpy(dtype=float)
+        liquid = (calls['volume'].to_numpy(dtype=float) > 0) & (bid > 0)
+        order = np.argsort(strike[liquid])
+        strikes = strike[liquid][order]
+        mid_prices = (0.5*(bid + ask))[liquid][order]
+        strikes.setflags(write=False)
+        mid_prices.setflags(write=False)
+        return strikes, mid_prices
+    
+    def _get_chain(self, ticker, expiry):
+        """Cached liquid (strikes, mid_prices) for a ticker and expiration"""
+        return self._cached(self._chain_cache, (ticker, expiry),
+                            lambda: self._fetch_chain(ticker, expiry))
     
     # ==================== CALCULATION METHODS ====================
     
     def black_scholes_call(self, S, K, T, r, sigma):
-        """Black-Scholes call option price"""
-        if T <= 0 or sigma <= 0:
-            return max(S - K, 0)
-        d1 = (np.log(S/K) + (r + 0.5*sigma**2)*T) / (sigma*np.sqrt(T))
-        d2 = d1 - sigma*np.sqrt(T)
-        return S*norm.cdf(d1) - K*np.exp(-r*T)*norm.cdf(d2)
+        """Black-Scholes call price for a single option (see black_scholes_call_vec)"""
+        return float(self.black_scholes_call_vec(S, K, T, r, sigma))
+    
+    def black_scholes_call_vec(self, S, Ks, T, r, sigmas, sqrt_T=None, disc=None):
+        """Black-Scholes call prices for arrays of strikes (see pricing.black_scholes_call_vec)"""
+        return pricing.black_scholes_call_vec(S, Ks, T, r, sigmas, sqrt_T=sqrt_T, disc=disc)
     
     def implied_volatility(self, market_price, S, K, T, r):
-        """Calculate implied volatility using Newton-Raphson"""
-        if market_price <= max(S - K*np.exp(-r*T), 0):
-            return np.nan
-        sigma = 0.3
-        for i in range(100):
-            price = self.black_scholes_call(S, K, T, r, sigma)
-            vega = S * norm.pdf((np.log(S/K) + (r + 0.5*sigma**2)*T) / (sigma*np.sqrt(T))) * np.sqrt(T)
-            if abs(vega) < 1e-10:
-                break
-            diff = market_price - price
-            if abs(diff) < 1e-6:
-                return sigma
-            sigma = sigma + diff/vega
-            if sigma <= 0:
-                return np.nan
-        return sigma if sigma > 0 else np.nan
+        """Implied volatility of a single call (see implied_volatility_slice)"""
+        return float(self.implied_volatility_slice(
+            np.array([market_price], dtype=float), S, np.array([K], dtype=float), T, r)[0])
+    
+    def implied_volatility_slice(self, market_prices, S, Ks, T, r,
+                                 tol=1e-8, max_iter=50, sqrt_T=None, disc=None):
+        """Implied volatilities for a whole strike slice (see pricing.implied_volatility_slice)"""
+        return pricing.implied_volatility_slice(market_prices, S, Ks, T, r, tol=tol,
+                                                max_iter=max_iter, sqrt_T=sqrt_T, disc=disc)
+    
+    def _svi_terms(self, params, k):
+        """Shared SVI intermediates (w, k - m, sqrt((k-m)^2 + sigma^2))"""
+        a, b, rho, m, sigma = params
+        km = k - m
+        root = np.hypot(km, sigma)
+        return a + b*(rho*km + root), km, root
     
     def svi_variance(self, k, params):
         """SVI model for total variance"""
         a, b, rho, m, sigma = params
-        return a + b * (rho * (k - m) + np.sqrt((k - m)**2 + sigma**2))
+        if _svi_variance_kernel is not None and _is_float_vector(k):
+            return _svi_variance_kernel(k, a, b, rho, m, sigma)
+        return self._svi_terms(params, k)[0]
     
     def svi_objective(self, params, k_data, var_data):
         """Objective function for SVI fitting"""
+        if (_svi_sse_kernel is not None and _is_float_vector(k_data)
+                and _is_float_vector(var_data)):
+            a, b, rho, m, sigma = params
+            return _svi_sse_kernel(k_data, var_data, a, b, rho, m, sigma)
         return np.sum((self.svi_variance(k_data, params) - var_data)**2)
     
+    def svi_residual(self, params, k_data, var_data):
+        """Residual vector for SVI least-squares fitting"""
+        if (_svi_residual_kernel is not None and _is_float_vector(k_data)
+                and _is_float_vector(var_data)):
+            a, b, rho, m, sigma = params
+            return _svi_residual_kernel(k_data, var_data, a, b, rho, m, sigma)
+        return self.svi_variance(k_data, params) - var_data
+    
+    def svi_jacobian(self, params, k_data, var_data, terms=None):
+        """Analytic Jacobian of svi_residual, shape (len(k_data), 5)
+        
+        terms may pass in _svi_terms(params, k_data) if already computed.
+        """
+        a, b, rho, m, sigma = params
+        _, km, root = terms if terms is not None else self._svi_terms(params, k_data)
+        return np.column_stack((
+            np.ones_like(k_data),       # d/da
+            rho*km + root,              # d/db
+            b*km,                       # d/drho
+            -b*(rho + km/root),         # d/dm
+            b*sigma/root                # d/dsigma
+        ))
+    
+    def svi_gradient(self, params, k_data, var_data):
+        """Analytic gradient of svi_objective (2 * J^T r)"""
+        return self._svi_sse_and_grad(params, k_data, var_data)[1]
+    
+    def _svi_sse_and_grad(self, params, k_data, var_data):
+        """svi_objective and svi_gradient from one pass (minimize jac=True)"""
+        if (_svi_sse_grad_kernel is not None and _is_float_vector(k_data)
+                and _is_float_vector(var_data)):
+            a, b, rho, m, sigma = params
+            return _svi_sse_grad_kernel(k_data, var_data, a, b, rho, m, sigma)
+        residual = self.svi_residual(params, k_data, var_data)
+        return (residual @ residual,
+                2*(self.svi_jacobian(params, k_data, var_data).T @ residual))
+    
+    def _svi_fit_functions(self, k_data, var_data):
+        """Residual and Jacobian callables for one least_squares run
+        
+        Without the Numba kernels, the Jacobian requested at the point
+        whose residual was just computed (as least_squares does) reuses its
+        intermediates. The memo lives in this closure, so concurrent fits
+        each get their own.
+        """
+        if (_svi_residual_kernel is not None and _is_float_vector(k_data)
+                and _is_float_vector(var_data)):
+            return (lambda params: self.svi_residual(params, k_data, var_data),
+                    lambda params: self.svi_jacobian(params, k_data, var_data))
+        
+        memo = {}
+        def terms(params):
+            key = tuple(params)
+            if key not in memo:
+                memo.clear()
+                memo[key] = self._svi_terms(params, k_data)
+            return memo[key]
+        
+        def residual(params):
+            return terms(params)[0] - var_data
+        
+        def jacobian(params):
+            return self.svi_jacobian(params, k_data, var_data, terms(params))
+        
+        return residual, jacobian
+    
+    def _svi_inner(self, m, sigma, k_data, var_data):
+        """Best (a, b, rho) for fixed (m, sigma) by linear least squares
+        
+        With m and sigma fixed, SVI is linear in (a, b, b*rho). The solution
+        is clipped to the admissible region (a, b >= 0, |rho| < 1).
+        
+        Returns:
+        --------
+        tuple : (a, b, rho, sse) with sse evaluated at the clipped params
+        """
+        km = k_data - m
+        root = np.hypot(km, sigma)
+        A = np.column_stack((np.ones_like(k_data), root, km))
+        (a, b, b_rho), *_ = np.linalg.lstsq(A, var_data, rcond=None)
+        a = max(a, 0.0)
+        b = max(b, 0.0)
+        rho = min(max(b_rho / max(b, 1e-12), -0.999), 0.999)
+        model = a + b*(rho*km + root)
+        return a, b, rho, np.sum((model - var_data)**2)
+    
+    def svi_seed(self, k_data, var_data):
+        """Quasi-explicit SVI calibration used as the starting point
+        
+        Nelder-Mead over the two nonlinear parameters (m, sigma) with the
+        remaining three solved in closed form by _svi_inner.
+        """
+        def outer(x):
+            return self._svi_inner(x[0], max(abs(x[1]), 1e-4), k_data, var_data)[3]
+        
+        result = minimize(outer, [0.0, 0.1], method='Nelder-Mead',
+                          options={'xatol': 1e-3, 'fatol': 1e-12})
+        m, sigma = result.x[0], max(abs(result.x[1]), 1e-4)
+        a, b, rho, _ = self._svi_inner(m, sigma, k_data, var_data)
+        return [a, b, rho, m, sigma]
+    
     def fit_svi(self, strikes, IVs, forward, tau):
         """Fit SVI model to implied volatility smile"""
         self.log("\n=== Starting SVI Optimization ===")
         k = np.log(strikes / forward)
         total_var = IVs**2 * tau
-        atm_var = np.median(total_var)
-        initial_guess = [atm_var, 0.1, 0.0, 0.0, 0.1]
+        
+        # Quasi-explicit (m, sigma) search seeds the full 5-parameter fit
+        initial_guess = self.svi_seed(k, total_var)
         
         self.log(f"Initial: a={initial_guess[0]:.4f}, b={initial_guess[1]:.4f}, " +
                 f"rho={initial_guess[2]:.4f}, m={initial_guess[3]:.4f}, sigma={initial_guess[4]:.4f}")
         
-        bounds = [(0, None), (0, None), (-1, 1), (None, None), (1e-6, None)]
+        bounds = ([0, 0, -1, -np.inf, 1e-6], [np.inf, np.inf, 1, np.inf, np.inf])
+        
+        def run(x0, max_nfev=None):
+            residual, jacobian = self._svi_fit_functions(k, total_var)
+            return least_squares(residual, x0, jac=jacobian, bounds=bounds,
+                                 method='trf', max_nfev=max_nfev)
+        
+        self.log("Running optimization (least squares, TRF)...")
+        result = run(initial_guess)
+        self.log(f"Converged: {result.success}, Evaluations: {result.nfev}, "
+                 f"Error: {2*result.cost:.6f}")
+        
+        if not result.success:
+            # Seeded fit stalled, possibly in a local minimum: retry from a
+            # (b, rho) grid around the ATM variance, all starts concurrently
+            # and each on a short evaluation budget
+            atm_var = total_var[np.argmin(np.abs(k))]
+            starts = [[atm_var, b0, rho0, 0.0, 0.1]
+                      for b0 in (0.05, 0.1, 0.2) for rho0 in (-0.3, 0.0, 0.3)]
+            self.log(f"Multi-start from {len(starts)} grid points...")
+            retries = list(self._fit_executor.map(lambda x0: run(x0, 100), starts))
+            best = min(range(len(retries)), key=lambda i: retries[i].cost)
+            if retries[best].cost < result.cost:
+                result = retries[best]
+                self.log(f"Best start: grid point {best + 1}, Error: {2*result.cost:.6f}")
+            else:
+                self.log("Best start: quasi-explicit seed")
+        
+        # cost is half the sum of squared residuals
+        params, error = result.x, 2*result.cost
         
-        self.log("Running optimization (L-BFGS-B)...")
-        result = minimize(self.svi_objective, initial_guess, 
-                         args=(k, total_var), method='L-BFGS-B', bounds=bounds)
+        if not result.success:
+            # Evaluation budget ran out: polish with L-BFGS-B on the scalar
+            # objective; value and analytic gradient share one pass (jac=True)
+            self.log("Refining with L-BFGS-B...")
+            fallback = minimize(self._svi_sse_and_grad, params, args=(k, total_var),
+                                jac=True, method='L-BFGS-B',
+                                bounds=list(zip(bounds[0], bounds[1])))
+            self.log(f"Converged: {fallback.success}, Iterations: {fallback.nit}, Error: {fallback.fun:.6f}")
+            if fallback.fun < error:
+                params, error = fallback.x, fallback.fun
         
-        self.log(f"Converged: {result.success}, Iterations: {result.nit}, Error: {result.fun:.6f}")
-        self.log(f"\nOptimal: a={result.x[0]:.6f}, b={result.x[1]:.6f}, " +
-                f"rho={result.x[2]:.6f}, m={result.x[3]:.6f}, sigma={result.x[4]:.6f}")
+        self.log(f"\nOptimal: a={params[0]:.6f}, b={params[1]:.6f}, " +
+                f"rho={params[2]:.6f}, m={params[3]:.6f}, sigma={params[4]:.6f}")
         
-        return result.x, k
+        return params, k
     
     def calculate_pdf_from_calls(self, strikes, call_prices, r, tau):
         """Extract PDF using Breeden-Litzenberger"""
         self.log("\n=== Extracting PDF via Breeden-Litzenberger ===")
         pdf_strikes = strikes[1:-1]
-        pdf_values = np.zeros(len(pdf_strikes))
-        
-        for i in range(len(pdf_strikes)):
-            dK = strikes[i+1] - strikes[i]
-            second_deriv = (call_prices[i] - 2*call_prices[i+1] + call_prices[i+2]) / (dK**2)
-            pdf_values[i] = np.exp(r * tau) * second_deriv
         
-        pdf_values = np.maximum(pdf_values, 0)
-        integral = np.trapz(pdf_values, pdf_strikes)
+        # Three-point second difference at every interior strike in one pass,
+        # using both neighbouring spacings (exact on non-uniform grids too)
+        h1 = strikes[1:-1] - strikes[:-2]
+        h2 = strikes[2:] - strikes[1:-1]
+        pdf_values = 2*(h2*call_prices[:-2] - (h1 + h2)*call_prices[1:-1]
+                        + h1*call_prices[2:]) / (h1*h2*(h1 + h2))
+        pdf_values *= np.exp(r * tau)
+        np.maximum(pdf_values, 0, out=pdf_values)
+        # Trapezoidal integral; after normalizing it is 1 by construction
+        integral = 0.5*np.sum((pdf_values[1:] + pdf_values[:-1]) * np.diff(pdf_strikes))
         if integral > 0:
-            pdf_values = pdf_values / integral
+            pdf_values /= integral
         
-        self.log(f"PDF extracted at {len(pdf_strikes)} points, integral: {np.trapz(pdf_values, pdf_strikes):.4f}")
+        status = "normalized to 1.0" if integral > 0 else "zero density, not normalized"
+        self.log(f"PDF extracted at {len(pdf_strikes)} points ({status})")
         return pdf_strikes, pdf_values
     
     def calculate_pdf(self):
-        """Main calculation pipeline"""
+        """Main calculation pipeline
+        
+        _fetch and _compute run on the worker thread; _calc_finish plots
+        the results on the Tk main thread and hands the analysis back to
+        the worker. The button stays disabled until _analysis_finish.
+        """
+        if self._calc_future is not None and not self._calc_future.done():
+            return  # Previous calculation still running
+        
+        self.output_text.delete(1.0, tk.END)
+        self.analysis_text.delete(1.0, tk.END)
+        
+        if UI_MODULE_AVAILABLE:
+            self.status_label.config(text="● Calculating...", 
+                                   foreground=self.theme.get_color('warning'))
+        else:
+            self.status_label.config(text="● Calculating...", foreground='orange')
+        
+        self.root.update_idletasks()
+        
+        ticker = self.ticker_entry.get().upper().strip()
+        if not ticker:
+            messagebox.showerror("Error", "Enter a ticker symbol.")
+            return
+        
+        self.log(f"Fetching options data for {ticker}...")
+        
+        self.calc_button.state(['disabled'])
+        self._calc_future = self._executor.submit(self._calc_worker, ticker)
+        self._calc_future.add_done_callback(
+            lambda future: self._post(self._calc_finish, future))
+        self.root.after(self.LOG_DRAIN_MS, self._drain_log)
+    
+    def _calc_worker(self, ticker):
+        """Fetch market data and run all calculations (worker thread)
+        
+        Must not touch Tk widgets; log() buffers messages on this thread.
+        
+        Returns:
+        --------
+        dict : Results for plotting, analysis and export
+        """
+        data = self._fetch(ticker)
+        if self._closing:
+            return None  # Quit during the download; nobody will read it
+        return self._compute(data)
+    
+    def _fetch(self, ticker):
+        """Network stage: spot price and the liquid calls of the first expiry
+        
+        Returns:
+        --------
+        dict : ticker, current_price, expiry, strikes (sorted) and mid_prices
+        """
+        # Fetch data (reused for CACHE_TTL seconds on repeat clicks)
+        _, current_price, expirations = self._get_ticker(ticker)
+        
+        self.log(f"Current price: ${current_price:.2f}")
+        
+        if not expirations:
+            raise ValueError("No options available")
+        
+        expiry = expirations[0]
+        self.log(f"Expiration: {expiry}")
+        
+        # Get options chain as plain arrays: liquid calls sorted by strike
+        all_strikes, mid_prices = self._get_chain(ticker, expiry)
+        
+        if len(all_strikes) < 5:
+            raise ValueError("Insufficient liquid options")
+        
+        self.log(f"Found {len(all_strikes)} liquid calls")
+        
+        return {'ticker': ticker, 'current_price': current_price, 'expiry': expiry,
+                'strikes': all_strikes, 'mid_prices': mid_prices}
+    
+    def _compute(self, data):
+        """Numerical stage: IVs, SVI fit and PDF from _fetch's market data
+        
+        Returns:
+        --------
+        dict : Results for plotting, analysis and export
+        """
+        ticker, current_price, expiry = data['ticker'], data['current_price'], data['expiry']
+        all_strikes, mid_prices = data['strikes'], data['mid_prices']
+        
+        # Calculate time to expiration
+        tau = (_parse_expiry(expiry) - datetime.now()).days / 365.0
+        self.log(f"Time to expiry: {tau:.4f} years ({tau*365:.0f} days)")
+        
+        r = 0.05  # Risk-free rate
+        
+        # Expiry invariants shared by the IV solve and the smooth pricing
+        sqrt_tau = np.sqrt(tau)
+        disc = np.exp(-r * tau)
+        
+        # Calculate IVs (NaN fails both comparisons, so it is dropped too)
+        all_IVs = self.implied_volatility_slice(
+            mid_prices, current_price, all_strikes, tau, r,
+            sqrt_T=sqrt_tau, disc=disc
+        )
+        keep = (all_IVs > 0.05) & (all_IVs < 2.0)
+        strikes, IVs = all_strikes[keep], all_IVs[keep]
+        self.log(f"Calculated IV for {len(IVs)} options")
+        
+        # Fit SVI
+        forward = current_price * np.exp(r * tau)
+        optimal_params, k = self.fit_svi(strikes, IVs, forward, tau)
+        
+        # Generate smooth curve (strikes stay sorted through the IV mask)
+        smooth_strikes = np.linspace(strikes[0], strikes[-1], 200)
+        k_smooth = np.log(smooth_strikes / forward)
+        fitted_var = self.svi_variance(k_smooth, optimal_params)
+        fitted_IVs = np.sqrt(fitted_var / tau)
+        
+        smooth_call_prices = self.black_scholes_call_vec(
+            current_price, smooth_strikes, tau, r, fitted_IVs,
+            sqrt_T=sqrt_tau, disc=disc
+        )
+        
+        # Extract PDF
+        pdf_strikes, pdf_values = self.calculate_pdf_from_calls(
+            smooth_strikes, smooth_call_prices, r, tau
+        )
+        
+        return {
+            'ticker': ticker, 'current_price': current_price,
+            'strikes': strikes, 'IVs': IVs,
+            'fitted_IVs': fitted_IVs, 'smooth_strikes': smooth_strikes,
+            'pdf_strikes': pdf_strikes, 'pdf_values': pdf_values,
+            'tau': tau, 'expiry': expiry, 'optimal_params': optimal_params
+        }
+    
+    def _calc_finish(self, future):
+        """Plot worker results and start the analysis (Tk main thread)
+        
+        analyze (a Claude round-trip when AI is on) runs on the worker;
+        its streamed chunks are posted back to stream_analysis.
+        """
+        self._flush_log()
         try:
-            self.output_text.delete(1.0, tk.END)
-            self.analysis_text.delete(1.0, tk.END)
-            
-            if UI_MODULE_AVAILABLE:
-                self.status_label.config(text="● Calculating...", 
-                                       foreground=self.theme.get_color('warning'))
-            else:
-                self.status_label.config(text="● Calculating...", foreground='orange')
-            
-            self.root.update()
-            
-            ticker = self.ticker_entry.get().upper().strip()
-            if not ticker:
-                messagebox.showerror("Error", "Enter a ticker symbol.")
-                return
-            
-            self.log(f"Fetching options data for {ticker}...")
+            results = future.result()
+            self.last_results = results
             
-            # Fetch data
-            stock = yf.Ticker(ticker)
-            current_price = stock.info.get('currentPrice', stock.info.get('regularMarketPrice'))
-            if current_price is None:
-                hist = stock.history(period='1d')
-                if hist.empty:
-                    raise ValueError("Ticker not found")
-                current_price = hist['Close'].iloc[-1]
-            
-            self.log(f"Current price: ${current_price:.2f}")
-            
-            expirations = stock.options
-            if not expirations:
-                raise ValueError("No options available")
-            
-            expiry = expirations[0]
-            self.log(f"Expiration: {expiry}")
-            
-            # Get options chain
-            calls = stock.option_chain(expiry).calls
-            calls = calls[(calls['volume'] > 0) & (calls['bid'] > 0)].sort_values('strike')
-            
-            if len(calls) < 5:
-                raise ValueError("Insufficient liquid options")
-            
-            self.log(f"Found {len(calls)} liquid calls")
-            
-            # Calculate time to expiration
-            tau = (datetime.strptime(expiry, '%Y-%m-%d') - datetime.now()).days / 365.0
-            self.log(f"Time to expiry: {tau:.4f} years ({tau*365:.0f} days)")
-            
-            r = 0.05  # Risk-free rate
-            
-            # Calculate IVs
-            strikes, IVs = [], []
-            for K, price in zip(calls['strike'].values, ((calls['bid'] + calls['ask'])/2).values):
-                iv = self.implied_volatility(price, current_price, K, tau, r)
-                if not np.isnan(iv) and 0.05 < iv < 2.0:
-                    strikes.append(K)
-                    IVs.append(iv)
-            
-            strikes, IVs = np.array(strikes), np.array(IVs)
-            self.log(f"Calculated IV for {len(IVs)} options")
-            
-            # Fit SVI
-            forward = current_price * np.exp(r * tau)
-            optimal_params, k = self.fit_svi(strikes, IVs, forward, tau)
-            
-            # Generate smooth curve
-            smooth_strikes = np.linspace(strikes.min(), strikes.max(), 200)
-            k_smooth = np.log(smooth_strikes / forward)
-            fitted_var = self.svi_variance(k_smooth, optimal_params)
-            fitted_IVs = np.sqrt(fitted_var / tau)
-            
-            smooth_call_prices = np.array([
-                self.black_scholes_call(current_price, K, tau, r, iv)
-                for K, iv in zip(smooth_strikes, fitted_IVs)
-            ])
-            
-            # Extract PDF
-            pdf_strikes, pdf_values = self.calculate_pdf_from_calls(
-                smooth_strikes, smooth_call_prices, r, tau
-            )
-            
-            # Store results
-            self.last_results = {
-                'ticker': ticker, 'current_price': current_price,
-                'strikes': strikes, 'IVs': IVs,
-                'fitted_IVs': fitted_IVs, 'smooth_strikes': smooth_strikes,
-                'pdf_strikes': pdf_strikes, 'pdf_values': pdf_values,
-                'tau': tau, 'expiry': expiry, 'optimal_params': optimal_params
-            }
-            
-            # Plot and analyze
-            self.plot_results(strikes, IVs, smooth_strikes, fitted_IVs,
-                            pdf_strikes, pdf_values, current_price, ticker)
-            
-            if AI_MODULE_AVAILABLE:
-                analysis = analyze(self.last_results, use_ai=self.use_ai.get())
-            else:
+            self.plot_results(results['strikes'], results['IVs'],
+                            results['smooth_strikes'], results['fitted_IVs'],
+                            results['pdf_strikes'], results['pdf_values'],
+                            results['current_price'], results['ticker'])
+        except Exception as e:
+            self._calc_error(e)
+            return
+        
+        if not AI_MODULE_AVAILABLE:
+            self._analysis_finish(None)
+            return
+        
+        self._calc_future = self._executor.submit(
+            analyze, results, use_ai=self.use_ai.get(),
+            on_chunk=self._chunk_queue.put)
+        self._calc_future.add_done_callback(
+            lambda future: self._post(self._analysis_finish, future))
+        self.root.after(self.STREAM_DRAIN_MS, self._drain_analysis)
+    
+    def _analysis_finish(self, future):
+        """Show the finished analysis and re-enable the button (Tk main thread)"""
+        try:
+            if future is None:
                 analysis = "⚠️ ai_analysis.py not found."
+            else:
+                analysis = future.result()
             
+            # Re-render the streamed text with bold (it replaces any
+            # chunks not drained yet)
+            _take_all(self._chunk_queue)
             self.log_analysis(analysis)
             self.log("\n=== Complete ===")
             
@@ -443,65 +929,128 @@ class OptionsPDFCalculator:
                                        foreground=self.theme.get_color('success'))
             else:
                 self.status_label.config(text="● Complete!", foreground='green')
-            
         except Exception as e:
-            self.log(f"\nERROR: {str(e)}")
-            messagebox.showerror("Error", str(e))
+            self._calc_error(e)
+            return
+        self.calc_button.state(['!disabled'])
+    
+    def _calc_error(self, error):
+        """Report a failed calculation or analysis and re-enable the button"""
+        try:
+            self.log(f"\nERROR: {str(error)}")
+            messagebox.showerror("Error", str(error))
             if UI_MODULE_AVAILABLE:
                 self.status_label.config(text="● Error", 
                                        foreground=self.theme.get_color('error'))
             else:
                 self.status_label.config(text="● Error", foreground='red')
+        finally:
+            self.calc_button.state(['!disabled'])
     
     def plot_results(self, strikes, IVs, smooth_strikes, fitted_IVs,
                     pdf_strikes, pdf_values, current_price, ticker):
-        """Plot IV smile and PDF"""
-        self.ax1.clear()
-        self.ax2.clear()
+        """Plot IV smile and PDF
         
-        # Get colors
-        if UI_MODULE_AVAILABLE:
-            market_color = self.theme.get_chart_color('market')
-            fit_color = self.theme.get_chart_color('fit')
-            current_color = self.theme.get_chart_color('current')
-            pdf_color = self.theme.get_chart_color('pdf')
-            fg = self.theme.get_color('fg')
-        else:
-            market_color, fit_color, current_color, pdf_color = '#58a6ff', '#f85149', '#3fb950', '#bc8cff'
-            fg = '#e6edf3'
+        The first call builds both axes; later calls update the existing
+        artists in place instead of clearing and rebuilding everything.
+        """
+        if self.plot_artists:
+            self._update_plot(strikes, IVs, smooth_strikes, fitted_IVs,
+                              pdf_strikes, pdf_values, current_price, ticker)
+            return
+        
+        # Colors cached by refresh_colors
+        colors = self._colors
+        market_color, fit_color = colors['market'], colors['fit']
+        current_color, pdf_color = colors['current'], colors['pdf']
+        fg = colors['fg']
         
         # Plot 1: IV Smile
-        self.ax1.scatter(strikes, IVs*100, alpha=0.8, s=60, 
+        market_scatter = self.ax1.scatter(strikes, IVs*100, alpha=0.8, s=60, 
                         color=market_color, edgecolors='white', linewidths=0.5, label='Market IVs')
-        self.ax1.plot(smooth_strikes, fitted_IVs*100, color=fit_color, 
+        fit_line, = self.ax1.plot(smooth_strikes, fitted_IVs*100, color=fit_color, 
                      linewidth=3, alpha=0.9, label='SVI Fit')
-        self.ax1.axvline(current_price, color=current_color, linestyle='--', 
+        current_line1 = self.ax1.axvline(current_price, color=current_color, linestyle='--', 
                         alpha=0.7, linewidth=2.5, label='Current Price')
         self.ax1.set_xlabel('Strike Price ($)', fontsize=12, color=fg, fontweight='500')
         self.ax1.set_ylabel('Implied Volatility (%)', fontsize=12, color=fg, fontweight='500')
-        self.ax1.set_title(f'{ticker} - Implied Volatility Smile', 
+        title1 = self.ax1.set_title(f'{ticker} - Implied Volatility Smile', 
                           fontsize=14, color=fg, pad=20, fontweight='600')
         self.ax1.legend(fontsize=10)
         
         # Plot 2: PDF
-        self.ax2.fill_between(pdf_strikes, pdf_values, alpha=0.4, color=pdf_color)
-        self.ax2.plot(pdf_strikes, pdf_values, color=pdf_color, 
+        pdf_fill = self.ax2.fill_between(pdf_strikes, pdf_values, alpha=0.4, color=pdf_color)
+        pdf_line, = self.ax2.plot(pdf_strikes, pdf_values, color=pdf_color, 
                      linewidth=3, alpha=0.9, label='Risk-Neutral PDF')
-        self.ax2.axvline(current_price, color=current_color, linestyle='--', 
+        current_line2 = self.ax2.axvline(current_price, color=current_color, linestyle='--', 
                         alpha=0.7, linewidth=2.5, label='Current Price')
         self.ax2.set_xlabel('Stock Price ($)', fontsize=12, color=fg, fontweight='500')
         self.ax2.set_ylabel('Probability Density', fontsize=12, color=fg, fontweight='500')
-        self.ax2.set_title(f'{ticker} - Probability Density Function', 
+        title2 = self.ax2.set_title(f'{ticker} - Probability Density Function', 
                           fontsize=14, color=fg, pad=20, fontweight='600')
         self.ax2.legend(fontsize=10)
         
+        self.plot_artists = {
+            'market': market_scatter, 'fit': fit_line,
+            'current': (current_line1, current_line2),
+            'pdf_fill': pdf_fill, 'pdf_line': pdf_line,
+            'titles': (title1, title2), 'ticker': ticker,
+        }
+        
         # Apply theme styling
         if UI_MODULE_AVAILABLE:
             style_plot_axes(self.ax1, self.theme)
             style_plot_axes(self.ax2, self.theme)
         
         self.fig.tight_layout(pad=3.0)
-        self.canvas.draw()
+        self.canvas.draw_idle()
+    
+    def _update_plot(self, strikes, IVs, smooth_strikes, fitted_IVs,
+                     pdf_strikes, pdf_values, current_price, ticker):
+        """Swap new data into the persistent plot artists
+        
+        Labels and legends built by the first plot are reused as-is; only
+        the title strings change, and only when the ticker does.
+        """
+        artists = self.plot_artists
+        
+        # Plot 1: IV Smile
+        artists['market'].set_offsets(np.column_stack((strikes, IVs*100)))
+        artists['fit'].set_data(smooth_strikes, fitted_IVs*100)
+        for line in artists['current']:
+            line.set_xdata([current_price, current_price])
+        
+        # Plot 2: PDF (the fill keeps its artist; only its polygon is replaced)
+        artists['pdf_line'].set_data(pdf_strikes, pdf_values)
+        pdf_fill = artists['pdf_fill']
+        if hasattr(pdf_fill, 'set_data'):
+            # matplotlib >= 3.10 FillBetweenPolyCollection; set_verts would
+            # leave its cached data limits stale
+            pdf_fill.set_data(pdf_strikes, pdf_values, 0)
+        else:
+            # Along the curve, then back along the zero baseline
+            n = len(pdf_strikes)
+            verts = np.empty((2*n, 2))
+            verts[:n, 0], verts[:n, 1] = pdf_strikes, pdf_values
+            verts[n:, 0], verts[n:, 1] = pdf_strikes[::-1], 0.0
+            pdf_fill.set_verts([verts])
+        
+        if ticker != artists['ticker']:
+            title1, title2 = artists['titles']
+            title1.set_text(f'{ticker} - Implied Volatility Smile')
+            title2.set_text(f'{ticker} - Probability Density Function')
+            artists['ticker'] = ticker
+        
+        # Rescale to the new data; older matplotlib relim() skips collections
+        self.ax1.relim()
+        self.ax1.update_datalim(artists['market'].get_offsets())
+        self.ax1.autoscale_view()
+        self.ax2.relim()
+        self.ax2.update_datalim([(pdf_strikes[0], 0.0)])
+        self.ax2.autoscale_view()
+        
+        self.fig.tight_layout(pad=3.0)
+        self.canvas.draw_idle()
 
 
 def main():
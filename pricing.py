@@ -0,0 +1,143 @@
+"""
+Pricing Module for Options PDF Calculator
+Vectorized Black-Scholes call prices and implied volatilities (NumPy/SciPy only)
+"""
+
+import math
+
+import numpy as np
+from scipy.special import ndtr
+
+# Standard normal PDF constant; the CDF is scipy.special.ndtr (a bare C ufunc)
+_INV_SQRT2PI = 1.0/math.sqrt(2.0*math.pi)
+
+
+def black_scholes_call_vec(S, Ks, T, r, sigmas, sqrt_T=None, disc=None):
+    """Black-Scholes call prices for arrays of strikes and volatilities
+    
+    sqrt_T and disc (exp(-r*T)) may be passed in when the caller has
+    already computed them for the same expiry.
+    """
+    Ks = np.asarray(Ks, dtype=float)
+    sigmas = np.asarray(sigmas, dtype=float)
+    intrinsic = np.maximum(S - Ks, 0)
+    if T <= 0:
+        return intrinsic
+    if sqrt_T is None:
+        sqrt_T = np.sqrt(T)
+    if disc is None:
+        disc = np.exp(-r*T)
+    vol_sqrt_T = sigmas*sqrt_T
+    # Zero-vol lanes divide by 0 here but are replaced by intrinsic below
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d1 = (np.log(S/Ks) + (r + 0.5*sigmas**2)*T) / vol_sqrt_T
+        d2 = d1 - vol_sqrt_T
+        prices = S*ndtr(d1) - Ks*disc*ndtr(d2)
+    return np.where(sigmas > 0, prices, intrinsic)
+
+
+def implied_volatility_slice(market_prices, S, Ks, T, r,
+                             tol=1e-8, max_iter=50, sqrt_T=None, disc=None):
+    """Implied volatilities for a whole strike slice at once
+    
+    Vectorized Householder(3) iteration on the log price,
+    log C(sigma) = log V,
+    from a Corrado-Miller seed. The log objective has no flat
+    convex/concave regions for far-from-the-money strikes. tol is
+    relative to the time value (price - intrinsic): deep in the money
+    the time value is a tiny part of the price, so a relative price
+    test would accept almost any sigma. A per-strike bisection bracket
+    guards the steps: the call price is increasing in sigma, so every
+    step tightens [lo, hi] and steps leaving it fall back to bisection.
+    
+    Parameters:
+    -----------
+    market_prices, Ks : array-like
+        Call prices and strikes
+    S, T, r : float
+        Spot price, time to expiry (years) and risk-free rate
+    sqrt_T, disc : float, optional
+        Precomputed sqrt(T) and exp(-r*T)
+    
+    Returns:
+    --------
+    np.ndarray : Implied volatilities, NaN where no arbitrage-free
+        solution exists in (1e-4, 5), the time value is below tol times
+        the price, or the iteration did not converge
+    """
+    market_prices = np.asarray(market_prices, dtype=float)
+    Ks = np.asarray(Ks, dtype=float)
+    if T <= 0:
+        return np.full(Ks.shape, np.nan)
+    
+    if sqrt_T is None:
+        sqrt_T = np.sqrt(T)
+    if disc is None:
+        disc = np.exp(-r*T)
+    # Loop invariants: d1 = x/(sigma*sqrt_T) + sigma*sqrt_T/2 with
+    # x = log(S/K) + r*T, and d1*d2 = a2/sigma^2 - sigma^2*T/4
+    strike_pv = Ks*disc
+    x = np.log(S/Ks) + r*T
+    a2 = x*x/T
+    vega_scale = S*_INV_SQRT2PI*sqrt_T
+    
+    # Prices must lie strictly inside the no-arbitrage bounds, with
+    # enough time value left to pin sigma down
+    time_value = market_prices - np.maximum(S - strike_pv, 0)
+    valid = (time_value > tol*market_prices) & (market_prices < S)
+    time_tol = tol*time_value
+    round_off = 8*np.finfo(float).eps*S
+    
+    # Corrado-Miller closed-form approximation as the starting point;
+    # fall back to 0.3 where it is undefined or outside the bracket
+    half_moneyness = 0.5*(S - strike_pv)
+    excess = market_prices - half_moneyness
+    radicand = np.maximum(excess**2 - (S - strike_pv)**2/np.pi, 0.0)
+    sigma = np.sqrt(2*np.pi)/(sqrt_T*(S + strike_pv)) * (excess + np.sqrt(radicand))
+    sigma = np.where((sigma > 1e-4) & (sigma < 5.0), sigma, 0.3)
+    
+    lo = np.full(Ks.shape, 1e-4)
+    hi = np.full(Ks.shape, 5.0)
+    active = valid.copy()
+    log_target = np.log(np.where(valid, market_prices, 1.0))
+    
+    # Model prices can underflow to 0 in the wings; those lanes bisect
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for i in range(max_iter):
+            if not active.any():
+                break
+            # d1, d2 and exp(-d1^2/2) are shared by the price and all
+            # three derivatives
+            vol_sqrt_T = sigma*sqrt_T
+            d1 = x/vol_sqrt_T + 0.5*vol_sqrt_T
+            d2 = d1 - vol_sqrt_T
+            nd1 = ndtr(d1)
+            price = S*nd1 - strike_pv*ndtr(d2)
+            vega = vega_scale*np.exp(-0.5*d1*d1)
+            g = np.log(price) - log_target
+            
+            # Converged once the price error is a tol fraction of the
+            # time value, or down at the rounding level of the spot leg
+            price_tol = np.maximum(time_tol, round_off*nd1)
+            active &= ~(np.abs(price - market_prices) < price_tol)
+            lo = np.where(active & (g < 0), sigma, lo)
+            hi = np.where(active & (g > 0), sigma, hi)
+            
+            # Householder(3) step on g from the closed-form vega, vomma
+            # (vega*h) and ultima (vega*(h^2 + h')), h = d1*d2/sigma;
+            # bisection where it is undefined or leaves the bracket
+            inv_sigma = 1.0/sigma
+            h = d1*d2*inv_sigma
+            dh = -3*a2*inv_sigma**4 - 0.25*T
+            g1 = vega/price
+            g2 = g1*(h - g1)
+            g3 = g1*(h*h + dh - 3*g2 - g1*g1)
+            newton = g/np.where(vega > 1e-10, g1, np.nan)
+            curvature = newton*g2/g1
+            step = sigma - (newton*(1 - 0.5*curvature)
+                            / (1 - curvature + newton*newton*g3/(6*g1)))
+            step = np.where((step > lo) & (step < hi), step, 0.5*(lo + hi))
+            sigma = np.where(active, step, sigma)
+    
+    sigma[~valid | active] = np.nan
+    return sigma
@@ -0,0 +1,29 @@
+"""Regression tests for the vectorized implied volatility solver"""
+
+import numpy as np
+import pytest
+
+from pricing import black_scholes_call_vec, implied_volatility_slice
+
+S, R = 100.0, 0.05
+
+
+def test_deep_itm_short_dated_is_not_the_seed():
+    """Time value below tol * price must not converge at the 0.3 fallback"""
+    T = 1/365
+    Ks = np.array([55.0])
+    price = black_scholes_call_vec(S, Ks, T, R, np.array([2.10]))
+    iv = implied_volatility_slice(price, S, Ks, T, R)
+    assert not (0.05 < iv[0] < 2.0)
+
+
+@pytest.mark.parametrize("T", [1/365, 7/365, 30/365, 1.0])
+@pytest.mark.parametrize("sigma", [0.1, 0.5, 2.1])
+def test_round_trip_across_moneyness(T, sigma):
+    """Every IV returned reprices to the input volatility"""
+    Ks = np.linspace(40, 200, 161)
+    prices = black_scholes_call_vec(S, Ks, T, R, np.full(Ks.shape, sigma))
+    iv = implied_volatility_slice(prices, S, Ks, T, R)
+    solved = ~np.isnan(iv)
+    assert solved.any()
+    np.testing.assert_allclose(iv[solved], sigma, atol=1e-6)
@@ -64,6 +64,8 @@ class ThemeManager:
         self.mode = mode
         self.current_theme = DARK_THEME if mode == 'dark' else LIGHT_THEME
         self.chart_colors = DARK_CHART_COLORS if mode == 'dark' else LIGHT_CHART_COLORS
+        # Direct-access alias of current_theme for the styling passes
+        self.colors = self.current_theme
     
     def get_color(self, key):
         """Get a color from current theme"""
@@ -78,6 +80,7 @@ class ThemeManager:
         self.mode = 'light' if self.mode == 'dark' else 'dark'
         self.current_theme = DARK_THEME if self.mode == 'dark' else LIGHT_THEME
         self.chart_colors = DARK_CHART_COLORS if self.mode == 'dark' else LIGHT_CHART_COLORS
+        self.colors = self.current_theme
         return self.mode
 
 
@@ -119,82 +122,101 @@ class StyleConfigurator:
         self.fonts = font_manager
         self.style = ttk.Style()
         self.style.theme_use('clam')
+        # Options last sent per style name, so unchanged styles are skipped
+        self._applied = {}
     
     def configure_all(self):
         """Configure all widget styles"""
-        self.configure_frames()
-        self.configure_labels()
-        self.configure_buttons()
-        self.configure_entries()
-        self.configure_checkbuttons()
-        self.configure_labelframes()
+        c = self.theme.colors
+        # Shared panel / text options, built once per pass
+        panel = {'background': c['panel'], 'foreground': c['fg']}
+        heading = {'background': c['panel'], 'foreground': c['accent'],
+                   'font': self.fonts.title_font}
+        self.configure_frames(c)
+        self.configure_labels(c, panel, heading)
+        self.configure_buttons(c)
+        self.configure_entries(c)
+        self.configure_checkbuttons(c, panel)
+        self.configure_labelframes(c, panel, heading)
     
-    def configure_frames(self):
+    def _configure(self, name, **opts):
+        """Send one batched configure for a style, skipping no-op updates"""
+        if self._applied.get(name) != opts:
+            self.style.configure(name, **opts)
+            self._applied[name] = opts
+    
+    def _map(self, name, **opts):
+        """Send one batched map for a style, skipping no-op updates"""
+        key = ('map', name)
+        if self._applied.get(key) != opts:
+            self.style.map(name, **opts)
+            self._applied[key] = opts
+    
+    def configure_frames(self, c=None):
         """Configure frame styles"""
-        self.style.configure('Card.TFrame',
-                           background=self.theme.get_color('panel'),
-                           relief='flat',
-                           borderwidth=1)
+        c = c or self.theme.colors
+        self._configure('Card.TFrame',
+                        background=c['panel'],
+                        relief='flat',
+                        borderwidth=1)
     
-    def configure_labels(self):
+    def configure_labels(self, c=None, panel=None, heading=None):
         """Configure label styles"""
-        self.style.configure('Modern.TLabel',
-                           background=self.theme.get_color('panel'),
-                           foreground=self.theme.get_color('fg'),
-                           font=self.fonts.normal_font)
-        
-        self.style.configure('Title.TLabel',
-                           background=self.theme.get_color('panel'),
-                           foreground=self.theme.get_color('accent'),
-                           font=self.fonts.title_font)
+        c = c or self.theme.colors
+        panel = panel or {'background': c['panel'], 'foreground': c['fg']}
+        heading = heading or {'background': c['panel'], 'foreground': c['accent'],
+                              'font': self.fonts.title_font}
+        self._configure('Modern.TLabel', font=self.fonts.normal_font, **panel)
+        self._configure('Title.TLabel', **heading)
     
-    def configure_buttons(self):
+    def configure_buttons(self, c=None):
         """Configure button styles"""
-        self.style.configure('Modern.TButton',
-                           background=self.theme.get_color('button'),
-                           foreground=self.theme.get_color('button_fg'),
-                           borderwidth=0,
-                           focuscolor='none',
-                           padding=(20, 10),
-                           font=self.fonts.button_font)
+        c = c or self.theme.colors
+        self._configure('Modern.TButton',
+                        background=c['button'],
+                        foreground=c['button_fg'],
+                        borderwidth=0,
+                        focuscolor='none',
+                        padding=(20, 10),
+                        font=self.fonts.button_font)
         
-        self.style.map('Modern.TButton',
-                     background=[
-                         ('active', self.theme.get_color('button_hover')),
-                         ('pressed', self.theme.get_color('button'))
-                     ],
-                     relief=[('pressed', 'flat'), ('!pressed', 'flat')])
+        self._map('Modern.TButton',
+                  background=[
+                      ('active', c['button_hover']),
+                      ('pressed', c['button'])
+                  ],
+                  relief=[('pressed', 'flat'), ('!pressed', 'flat')])
     
-    def configure_entries(self):
+    def configure_entries(self, c=None):
         """Configure entry styles"""
-        self.style.configure('Modern.TEntry',
-                           fieldbackground=self.theme.get_color('input'),
-                           foreground=self.theme.get_color('fg'),
-                           bordercolor=self.theme.get_color('border'),
-                           lightcolor=self.theme.get_color('input'),
-                           darkcolor=self.theme.get_color('input'),
-                           insertcolor=self.theme.get_color('fg'))
+        c = c or self.theme.colors
+        self._configure('Modern.TEntry',
+                        fieldbackground=c['input'],
+                        foreground=c['fg'],
+                        bordercolor=c['border'],
+                        lightcolor=c['input'],
+                        darkcolor=c['input'],
+                        insertcolor=c['fg'])
     
-    def configure_checkbuttons(self):
+    def configure_checkbuttons(self, c=None, panel=None):
         """Configure checkbutton styles"""
-        self.style.configure('Modern.TCheckbutton',
-                           background=self.theme.get_color('panel'),
-                           foreground=self.theme.get_color('fg'),
-                           font=self.fonts.normal_font)
+        c = c or self.theme.colors
+        panel = panel or {'background': c['panel'], 'foreground': c['fg']}
+        self._configure('Modern.TCheckbutton', font=self.fonts.normal_font, **panel)
     
-    def configure_labelframes(self):
+    def configure_labelframes(self, c=None, panel=None, heading=None):
         """Configure labelframe styles"""
-        self.style.configure('Modern.TLabelframe',
-                           background=self.theme.get_color('panel'),
-                           foreground=self.theme.get_color('fg'),
-                           bordercolor=self.theme.get_color('border'),
-                           relief='solid',
-                           borderwidth=1)
+        c = c or self.theme.colors
+        panel = panel or {'background': c['panel'], 'foreground': c['fg']}
+        heading = heading or {'background': c['panel'], 'foreground': c['accent'],
+                              'font': self.fonts.title_font}
+        self._configure('Modern.TLabelframe',
+                        bordercolor=c['border'],
+                        relief='solid',
+                        borderwidth=1,
+                        **panel)
         
-        self.style.configure('Modern.TLabelframe.Label',
-                           background=self.theme.get_color('panel'),
-                           foreground=self.theme.get_color('accent'),
-                           font=self.fonts.title_font)
+        self._configure('Modern.TLabelframe.Label', **heading)
 
 
 def enable_high_dpi():